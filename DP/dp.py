@@ -12,6 +12,11 @@ https://pythontutor.com
 9. DP on Grid
 10. other types
 '''
+from array import array
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it only enables the vectorized knapsack
+    np = None
 '''
 
 --------------------------------
@@ -118,6 +123,47 @@ def knapsack_tab(wt,val,W,n):
                 dp[i][j] = dp[i-1][j]
     return dp[n][W]
 
+# SPACE OPTIMIZED TABULATION -- ONE ROLLING ROW
+'''
+Row i of the table only reads row i-1, so one row dp[0..W] is enough:
+    new dp[j] = max(dp[j], dp[j-wt] + val)   for j >= wt
+Updating in place from right to left, dp[j-wt] is still the old row when
+dp[j] is written, so every item is used at most once.
+Memory: one typed array of W+1 machine ints instead of (n+1)*(W+1) boxed
+ints, no temporaries per item and no recursion.
+Time: O(n*W). The typed-array loop is still one Python step per cell;
+knapsack_numpy does each item as one vector op (np.maximum over shifted
+slices, with one O(W) temporary for dp[:W+1-wt] + val).
+Zero-weight items are always counted (the W==0 base case above skips them).
+'''
+def knapsack_rolling(wt,val,W,n,typecode='q'):
+    '''
+    0-1 knapsack in O(W) memory
+    Uses knapsack_numpy whenever NumPy is installed, otherwise updates
+    one array(typecode) row in place.
+    typecode: 'q' = int64 values, 'd' = float values (same on both paths)
+    '''
+    if np is not None:
+        return knapsack_numpy(wt,val,W,n,typecode)
+    dp = array(typecode, [0]) * (W+1)
+    for i in range(n):
+        w, v = wt[i], val[i]
+        for j in range(W, w-1, -1):
+            candidate = dp[j-w] + v
+            if candidate > dp[j]:
+                dp[j] = candidate
+    return dp[W]
+
+def knapsack_numpy(wt,val,W,n,typecode='q'):
+    dp = np.zeros(W+1, dtype=typecode)
+    for i in range(n):
+        w, v = wt[i], val[i]
+        if w > W:
+            continue
+        # dp[:W+1-w] + v is a new array, so the overlapping write is safe
+        np.maximum(dp[w:], dp[:W+1-w] + v, out=dp[w:])
+    return dp[W].item()
+
 # Subset sum problem
 '''
 q: given a set of non-negative integers, 
@@ -0,0 +1,153 @@
+"""
+HEAP BENCHMARK SUITE
+====================
+
+Compares the heap structures in heap.py against plain heapq on the same
+deterministic workloads and writes one JSON record per
+(benchmark, implementation, size), like Trees/benchmark.py.
+
+Timing, tracemalloc peaks and the JSON-lines output come from
+benchmark_harness.py at the repository root, shared with Trees/benchmark.py.
+
+Benchmarks:
+    priority_updates -> push n keys, change n/2 priorities, pop everything
+                        IndexedPriorityQueue vs heapq with lazy deletion
+    push_pop         -> push n floats one by one, then pop them all
+                        DaryHeap (arity 2, 4, 8) vs heapq
+    bulk_build_pop   -> build a heap from n floats, pop the n/10 smallest
+                        DaryHeap(values) + pop_many vs heapify + heappop
+
+Usage:
+    python benchmark.py --sizes 1e4 1e5 --output results.jsonl --label my-branch
+"""
+import argparse
+import heapq
+import os
+import random
+import sys
+
+if __name__ == "__main__":
+    # Run as a script from its folder: make the shared harness at the
+    # repository root importable (importers put the root on sys.path)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmark_harness import add_common_arguments, common_fields, open_output, run_case
+from heap import DaryHeap, IndexedPriorityQueue
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5)
+SEED = 12345
+ARITIES = (2, 4, 8)
+
+
+# WORKLOADS
+def priority_workload(n, seed=SEED):
+    rng = random.Random(seed)
+    pushes = [(key, rng.random()) for key in range(n)]
+    updates = [(rng.randrange(n), rng.random()) for _ in range(n // 2)]
+    return pushes, updates
+
+
+def run_indexed_pq(pushes, updates):
+    queue = IndexedPriorityQueue()
+    for key, priority in pushes:
+        queue.push(key, priority)
+    for key, priority in updates:
+        queue.update(key, priority)
+    while queue:
+        queue.pop()
+
+
+def run_heapq_lazy(pushes, updates):
+    # heapq recipe: stale entries are flagged and skipped when popped
+    heap, entries = [], {}
+    for key, priority in pushes:
+        entry = [priority, key, True]
+        entries[key] = entry
+        heapq.heappush(heap, entry)
+    for key, priority in updates:
+        entries.pop(key)[2] = False
+        entry = [priority, key, True]
+        entries[key] = entry
+        heapq.heappush(heap, entry)
+    while heap:
+        priority, key, live = heapq.heappop(heap)
+        if live:
+            del entries[key]
+
+
+def float_workload(n, seed=SEED):
+    rng = random.Random(seed)
+    return ([rng.random() for _ in range(n)],)
+
+
+def run_heapq_push_pop(values):
+    heap = []
+    for value in values:
+        heapq.heappush(heap, value)
+    while heap:
+        heapq.heappop(heap)
+
+
+def run_dary_push_pop(arity):
+    def run(values):
+        heap = DaryHeap(arity=arity)
+        for value in values:
+            heap.push(value)
+        while heap:
+            heap.pop()
+    return run
+
+
+def run_heapq_bulk(values):
+    heap = list(values)
+    heapq.heapify(heap)
+    for _ in range(len(heap) // 10):
+        heapq.heappop(heap)
+
+
+def run_dary_bulk(arity):
+    def run(values):
+        DaryHeap(values, arity=arity).pop_many(len(values) // 10)
+    return run
+
+
+# Each entry: benchmark -> (workload(n) -> args, {implementation: run(*args)})
+BENCHMARKS = {
+    'priority_updates': (priority_workload, {
+        'IndexedPriorityQueue': run_indexed_pq,
+        'heapq_lazy_deletion': run_heapq_lazy,
+    }),
+    'push_pop': (float_workload, dict(
+        {'heapq': run_heapq_push_pop},
+        **{f'DaryHeap_{d}': run_dary_push_pop(d) for d in ARITIES})),
+    'bulk_build_pop': (float_workload, dict(
+        {'heapq': run_heapq_bulk},
+        **{f'DaryHeap_{d}': run_dary_bulk(d) for d in ARITIES})),
+}
+
+
+def run_suite(sizes=DEFAULT_SIZES, benchmarks=None, repeat=3, memory=True,
+              label=None, out=sys.stdout):
+    """Run the benchmarks and write one JSON object per line to out."""
+    common = common_fields(label)
+    for name in benchmarks or list(BENCHMARKS):
+        workload, implementations = BENCHMARKS[name]
+        for size in sizes:
+            args = workload(size)
+            for impl, run in implementations.items():
+                record = dict(common, benchmark=name, impl=impl, size=size)
+                run_case(out, record, run, lambda: args, repeat, memory)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    add_common_arguments(parser, DEFAULT_SIZES)
+    parser.add_argument('--benchmarks', nargs='+', choices=sorted(BENCHMARKS))
+    args = parser.parse_args(argv)
+
+    with open_output(args.output) as out:
+        run_suite(args.sizes, args.benchmarks, args.repeat,
+                  not args.no_memory, args.label, out)
+
+
+if __name__ == "__main__":
+    main()
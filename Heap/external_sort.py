@@ -0,0 +1,160 @@
+"""
+K-WAY MERGE AND EXTERNAL SORT
+=============================
+
+k-way merge: a min-heap holds the current head of every sorted run,
+    pop the smallest head, emit it, push the next value from the same run.
+    n values over k runs -> O(n log k) time, O(k) memory.
+
+External sort (data larger than RAM):
+    1. cut the input into runs of `run_size` values, sort each in memory
+       and spill it to a temporary file
+    2. k-way merge the run files, reading each in fixed-size blocks
+    If there are more runs than `fan_in`, groups of runs are merged into
+    bigger runs first, so the number of open files stays bounded.
+
+Run files hold raw typed values (array typecode, 'q' = int64, 'd' = float)
+and are read back one block at a time into an array, so only
+k * block_size values are in memory during the merge.
+"""
+from array import array
+from itertools import chain, islice
+import heapq
+import os
+import tempfile
+
+BLOCK_SIZE = 1 << 16  # values per buffered block read
+FAN_IN = 128          # maximum number of runs merged at once
+
+
+def merge_sorted(iterables, key=None):
+    """
+    Lazily merge sorted iterables into one sorted stream
+    Ties keep the order of the input iterables (stable).
+    Time Complexity: O(n log k)
+    Space Complexity: O(k)
+    """
+    heap = []
+    for order, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            heap.append((value if key is None else key(value), order, value, iterator))
+            break
+    heapq.heapify(heap)
+    while heap:
+        _, order, value, iterator = heap[0]
+        yield value
+        for value in iterator:
+            heapq.heapreplace(heap, (value if key is None else key(value), order, value, iterator))
+            break
+        else:
+            heapq.heappop(heap)
+
+
+# RUN FILES
+def write_run(values, path, typecode='q', block_size=BLOCK_SIZE):
+    """Write values (any iterable) to a run file, one block at a time."""
+    iterator = iter(values)
+    with open(path, 'wb') as fp:
+        while True:
+            block = array(typecode, islice(iterator, block_size))
+            if not block:
+                break
+            block.tofile(fp)
+
+
+def read_run(path, typecode='q', block_size=BLOCK_SIZE):
+    """Stream the values of a run file, reading block_size values at a time."""
+    itemsize = array(typecode).itemsize
+    with open(path, 'rb') as fp:
+        while True:
+            data = fp.read(block_size * itemsize)
+            if not data:
+                return
+            block = array(typecode)
+            block.frombytes(data)
+            yield from block
+
+
+def read_text_run(path, convert=int, buffer_size=BLOCK_SIZE * 16):
+    """Stream one value per line from a sorted text shard through a large buffer."""
+    with open(path, 'r', buffering=buffer_size) as fp:
+        for line in fp:
+            yield convert(line)
+
+
+def merge_run_files(paths, typecode='q', block_size=BLOCK_SIZE):
+    """k-way merge of sorted run files."""
+    return merge_sorted([read_run(path, typecode, block_size) for path in paths])
+
+
+# EXTERNAL SORT
+def external_sort(values, run_size=1 << 20, typecode='q', tmpdir=None,
+                  block_size=BLOCK_SIZE, fan_in=FAN_IN):
+    """
+    Sort an iterable of any size with O(run_size + fan_in * block_size) memory
+    Yields the values in ascending order; temporary run files are removed
+    when the generator finishes or is closed.
+    Time Complexity: O(n log n)
+    """
+    workdir = tempfile.mkdtemp(prefix='extsort-', dir=tmpdir)
+    runs = []
+    try:
+        iterator = iter(values)
+        while True:
+            run = sorted(islice(iterator, run_size))
+            if not run:
+                break
+            path = os.path.join(workdir, f'run-{len(runs)}')
+            write_run(run, path, typecode, block_size)
+            runs.append(path)
+            del run
+
+        # Merge groups of runs until one merge pass can take them all
+        while len(runs) > fan_in:
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                path = os.path.join(workdir, f'run-{len(runs)}-{start}')
+                write_run(merge_run_files(group, typecode, block_size), path, typecode, block_size)
+                for old in group:
+                    os.remove(old)
+                merged.append(path)
+            runs = merged
+
+        yield from merge_run_files(runs, typecode, block_size)
+    finally:
+        for path in os.listdir(workdir):
+            os.remove(os.path.join(workdir, path))
+        os.rmdir(workdir)
+
+
+# ORDER STATISTICS OVER THE MERGED STREAM
+def merged_nsmallest(iterables, k):
+    """k smallest values of sorted runs: the first k values of the merge."""
+    return list(islice(merge_sorted(iterables), k))
+
+
+def merged_nlargest(iterables, k):
+    """k largest values of the runs, largest first, with a bounded heap of size k."""
+    return heapq.nlargest(k, chain.from_iterable(iterables))
+
+
+def merged_kth_smallest(iterables, k):
+    """k-th smallest value (1-based) of sorted runs, reading only k values."""
+    for value in islice(merge_sorted(iterables), k - 1, None):
+        return value
+    raise ValueError(f'fewer than {k} values in the runs')
+
+
+if __name__ == "__main__":
+    import random
+
+    runs = [sorted(random.sample(range(1000), 10)) for _ in range(4)]
+    print("merged head:", list(islice(merge_sorted(runs), 8)))
+    print("3 smallest:", merged_nsmallest(runs, 3), "5th smallest:", merged_kth_smallest(runs, 5))
+    print("3 largest:", merged_nlargest(runs, 3))
+
+    data = [random.randint(-10 ** 6, 10 ** 6) for _ in range(100000)]
+    result = list(external_sort(data, run_size=7000, fan_in=4))
+    print("external sort ok:", result == sorted(data))
@@ -17,17 +17,86 @@
 -k th smallest element in a stream
 '''
 import heapq
+import random
+from array import array
 from collections import Counter
+from collections import defaultdict
 from collections import deque
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it only enables fast paths
+    np = None
+
+# Below this fraction of n, a bounded heap (nsmallest/nlargest) beats selection
+HEAP_SELECT_RATIO = 0.01
+
+
+def select_kth(nums, k):
+    """
+    k-th smallest (1-based) by expected-linear selection, input left untouched
+    NumPy arrays use np.partition (introselect in C, works on a copy).
+    Otherwise quickselect with a median-of-3 random pivot over a copy, and
+    a sort of the remaining candidates if partitioning stops shrinking
+    them (introselect-style O(n log n) worst case).
+    Time Complexity: O(n) expected
+    Space Complexity: O(n)
+    """
+    n = len(nums)
+    if not 1 <= k <= n:
+        raise ValueError(f'k={k} out of range for {n} values')
+    if np is not None and isinstance(nums, np.ndarray):
+        return np.partition(nums, k - 1)[k - 1].item()
+    values = list(nums)
+    k -= 1
+    budget = 2 * n.bit_length()
+    while len(values) > 32 and budget:
+        budget -= 1
+        pivot = sorted(random.sample(values, 3))[1]
+        less = [v for v in values if v < pivot]
+        if k < len(less):
+            values = less
+            continue
+        greater = [v for v in values if v > pivot]
+        equal = len(values) - len(less) - len(greater)
+        if k < len(less) + equal:
+            return pivot
+        k -= len(less) + equal
+        values = greater
+    return sorted(values)[k]
+
+
+def _kth_smallest(nums, k):
+    """Pick the cheapest exact strategy for the k-th smallest given n and k."""
+    if not hasattr(nums, '__len__'):
+        # Plain iterables can only be read once: bounded heap, O(n log k)
+        if k < 1:
+            raise ValueError(f'k={k} out of range')
+        smallest = heapq.nsmallest(k, nums)
+        if len(smallest) < k:
+            raise ValueError(f'k={k} out of range for {len(smallest)} values')
+        return smallest[-1]
+    n = len(nums)
+    if not 1 <= k <= n:
+        raise ValueError(f'k={k} out of range for {n} values')
+    if np is not None and isinstance(nums, np.ndarray):
+        return select_kth(nums, k)
+    limit = max(1, int(n * HEAP_SELECT_RATIO))
+    if k <= limit:
+        # Bounded heap of size k: O(n log k)
+        return heapq.nsmallest(k, nums)[-1]
+    if n - k + 1 <= limit:
+        # Same from the other end
+        return heapq.nlargest(n - k + 1, nums)[-1]
+    return select_kth(nums, k)
+
+
 class Heap:
     def kth_smallest(self, nums, k):
-        return heapq.nsmallest(k, nums)[-1]
+        return _kth_smallest(nums, k)
 
     def kth_smallest_heap(self, nums, k):
-        heapq.heapify(nums)
-        for i in range(k):
-            heapq.heappop(nums)
-        return nums[0]
+        # Used to heapify the caller's list in place; now never mutates nums
+        return _kth_smallest(nums, k)
     def kth_smallest_heap_(self, nums, k):
         heap=[]
         for i in range(len(nums)):
@@ -36,7 +105,25 @@ class Heap:
                 heapq.heappop(heap)
         return heap[0]
 
-    def topKFrequent(self, nums, k) :
+    def topKFrequent(self, nums, k, capacity=None) :
+        """
+        k most frequent items as a deque, most frequent first (ties in any order)
+            capacity given        -> bounded-memory estimate, see SpaceSaving
+            NumPy integer array   -> np.unique counts + argpartition
+            anything else         -> Counter + frequency buckets, O(n) for any k
+        """
+        if capacity is not None:
+            summary = SpaceSaving(capacity)
+            summary.update_many(nums)
+            result = [item for item, _, _ in summary.top(k)]
+        elif np is not None and isinstance(nums, np.ndarray) and nums.dtype.kind in 'iub':
+            result = _top_k_frequent_numpy(nums, k)
+        else:
+            result = _top_k_frequent_buckets(Counter(nums), k)
+        return deque(result)
+
+    def topKFrequent_heap(self, nums, k) :
+        # Heap version: O(u log k) for u distinct items
         counted = Counter(nums)
         min_heap = []
         result = deque()
@@ -49,8 +136,681 @@ class Heap:
             result.appendleft(min_heap[i][1])
         return result
 
+
+def _top_k_frequent_buckets(counted, k):
+    """
+    Bucket items by frequency, then read buckets from the most frequent down
+    Only counts that occur get a bucket; n items have at most O(sqrt n)
+    distinct counts, since c distinct counts need 1 + 2 + ... + c items.
+    Time Complexity: O(u + c log c) for u distinct items and c distinct counts
+    Space Complexity: O(u)
+    """
+    if k <= 0 or not counted:
+        return []
+    buckets = defaultdict(list)
+    for item, count in counted.items():
+        buckets[count].append(item)
+    result = []
+    for count in sorted(buckets, reverse=True):
+        result.extend(buckets[count])
+        if len(result) >= k:
+            return result[:k]
+    return result
+
+
+def _top_k_frequent_numpy(nums, k):
+    """Vectorized counting for integer arrays: unique counts + argpartition."""
+    if k <= 0 or nums.size == 0:
+        return []
+    values, counts = np.unique(nums, return_counts=True)
+    return _top_k_from_unique_counts(values, counts, k)
+
+
+def _top_k_from_unique_counts(values, counts, k):
+    """k most frequent of sorted unique values with their counts (ties by value)."""
+    if k < len(values):
+        idx = np.argpartition(-counts, k - 1)[:k]
+    else:
+        idx = np.arange(len(values))
+    idx = idx[np.argsort(-counts[idx], kind='stable')]
+    return values[idx].tolist()
+
+
+class SpaceSaving:
+    """
+    Bounded-memory heavy hitters (Space-Saving, Metwally et al.)
+    Tracks at most `capacity` items. An unseen item evicts the item with
+    the smallest count and inherits that count as its error, so for every
+    tracked item
+        count - error <= true frequency <= count
+    and every item with true frequency > n / capacity is tracked.
+    The smallest counter is found through a heap with lazy entries, which
+    is rebuilt when stale entries pile up.
+    update: O(log capacity) amortized, memory: O(capacity).
+    Summaries are mergeable, so partial results from shards can be combined.
+    """
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self.capacity = capacity
+        self.counts = {}  # item -> [count, error]
+        self.heap = []    # (count, seq, item); stale when count changed
+        self.seq = 0
+        self.n = 0
+
+    def update(self, item, count=1):
+        self.n += count
+        entry = self.counts.get(item)
+        if entry is not None:
+            entry[0] += count
+        elif len(self.counts) < self.capacity:
+            entry = self.counts[item] = [count, 0]
+        else:
+            floor = self._pop_min()
+            entry = self.counts[item] = [floor + count, floor]
+        self._push(entry[0], item)
+
+    def update_many(self, items):
+        for item in items:
+            self.update(item)
+
+    @property
+    def min_count(self):
+        """Upper bound on the frequency of any untracked item."""
+        if len(self.counts) < self.capacity:
+            return 0
+        self._clean_top()
+        return self.heap[0][0]
+
+    @property
+    def max_error(self):
+        """No estimate exceeds the true frequency by more than n / capacity."""
+        return self.n / self.capacity
+
+    def top(self, k):
+        """k largest estimates as (item, count, error), most frequent first."""
+        best = heapq.nlargest(k, self.counts.items(), key=lambda kv: kv[1][0])
+        return [(item, count, error) for item, (count, error) in best]
+
+    def merge(self, other):
+        """
+        Combine two summaries of the same capacity into a new one
+        An item missing from one side may still have occurred there up to
+        that side's min_count times, which is added to count and error.
+        Equal capacities keep max_error = n / capacity valid for the merged
+        n; a smaller side could be off by far more than that.
+        """
+        if self.capacity != other.capacity:
+            raise ValueError(f'cannot merge summaries of capacity {self.capacity} '
+                             f'and {other.capacity}')
+        merged = SpaceSaving(self.capacity)
+        merged.n = self.n + other.n
+        floor_a, floor_b = self.min_count, other.min_count
+        combined = {}
+        for item in self.counts.keys() | other.counts.keys():
+            count_a, error_a = self.counts.get(item, (floor_a, floor_a))
+            count_b, error_b = other.counts.get(item, (floor_b, floor_b))
+            combined[item] = [count_a + count_b, error_a + error_b]
+        for item, entry in heapq.nlargest(merged.capacity, combined.items(),
+                                          key=lambda kv: kv[1][0]):
+            merged.counts[item] = entry
+            merged._push(entry[0], item)
+        return merged
+
+    def _push(self, count, item):
+        heapq.heappush(self.heap, (count, self.seq, item))
+        self.seq += 1
+        if len(self.heap) > 4 * self.capacity:
+            # Drop stale entries: one live entry per tracked item
+            self.heap = [(entry[0], i, item) for i, (item, entry) in enumerate(self.counts.items())]
+            heapq.heapify(self.heap)
+            self.seq = len(self.heap)
+
+    def _clean_top(self):
+        heap, counts = self.heap, self.counts
+        while True:
+            count, _, item = heap[0]
+            entry = counts.get(item)
+            if entry is not None and entry[0] == count:
+                return
+            heapq.heappop(heap)
+
+    def _pop_min(self):
+        self._clean_top()
+        count, _, item = heapq.heappop(self.heap)
+        del self.counts[item]
+        return count
+
+
+class IndexedPriorityQueue:
+    """
+    Min priority queue with decrease-key and removal by key
+    Array-backed binary heap: priorities live in a typed array, keys in
+    a parallel list, and `position` maps every key to its heap slot, so a
+    key can be found and re-sifted in place instead of rebuilding the heap.
+    push / pop / update / remove: O(log n), peek / contains: O(1).
+    typecode 'd' (default) stores priorities as floats, so 5 comes back as
+    5.0 and integers above 2**53 lose precision; use 'q' for exact 64-bit
+    integer priorities such as nanosecond timestamps.
+    """
+    def __init__(self, typecode='d'):
+        self.keys = []
+        self.priorities = array(typecode)
+        self.position = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.position
+
+    def priority(self, key):
+        return self.priorities[self.position[key]]
+
+    def push(self, key, priority):
+        if key in self.position:
+            raise ValueError(f'{key!r} is already queued, use update()')
+        self.keys.append(key)
+        self.priorities.append(priority)
+        self.position[key] = len(self.keys) - 1
+        self._sift_up(len(self.keys) - 1)
+
+    def peek(self):
+        if not self.keys:
+            raise IndexError('peek from an empty priority queue')
+        return self.keys[0], self.priorities[0]
+
+    def pop(self):
+        if not self.keys:
+            raise IndexError('pop from an empty priority queue')
+        top = (self.keys[0], self.priorities[0])
+        self._delete_at(0)
+        return top
+
+    def remove(self, key):
+        """Remove key from anywhere in the heap, returns its priority."""
+        i = self.position[key]
+        priority = self.priorities[i]
+        self._delete_at(i)
+        return priority
+
+    def decrease_key(self, key, priority):
+        i = self.position[key]
+        if priority > self.priorities[i]:
+            raise ValueError('new priority is larger than the current one')
+        self.priorities[i] = priority
+        self._sift_up(i)
+
+    def increase_key(self, key, priority):
+        i = self.position[key]
+        if priority < self.priorities[i]:
+            raise ValueError('new priority is smaller than the current one')
+        self.priorities[i] = priority
+        self._sift_down(i)
+
+    def update(self, key, priority):
+        """Set any new priority, pushing the key if it is not queued."""
+        if key not in self.position:
+            self.push(key, priority)
+        elif priority < self.priorities[self.position[key]]:
+            self.decrease_key(key, priority)
+        else:
+            self.increase_key(key, priority)
+
+    def _delete_at(self, i):
+        keys, priorities = self.keys, self.priorities
+        del self.position[keys[i]]
+        last_key, last_priority = keys.pop(), priorities.pop()
+        if i == len(keys):
+            return
+        # Move the last entry into the hole, then restore the heap property
+        keys[i], priorities[i] = last_key, last_priority
+        self.position[last_key] = i
+        self._sift_up(i)
+        self._sift_down(self.position[last_key])
+
+    def _sift_up(self, i):
+        keys, priorities, position = self.keys, self.priorities, self.position
+        key, priority = keys[i], priorities[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if priorities[parent] <= priority:
+                break
+            keys[i], priorities[i] = keys[parent], priorities[parent]
+            position[keys[i]] = i
+            i = parent
+        keys[i], priorities[i] = key, priority
+        position[key] = i
+
+    def _sift_down(self, i):
+        keys, priorities, position = self.keys, self.priorities, self.position
+        n = len(keys)
+        key, priority = keys[i], priorities[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priority <= priorities[child]:
+                break
+            keys[i], priorities[i] = keys[child], priorities[child]
+            position[keys[i]] = i
+            i = child
+        keys[i], priorities[i] = key, priority
+        position[key] = i
+
+
+class DaryHeap:
+    """
+    Min-heap of numbers stored in a typed array, with a configurable arity
+    The children of slot i are d*i+1 .. d*i+d and its parent is (i-1)//d,
+    so the tree is only log_d(n) levels deep and the children of a node sit
+    next to each other in memory. Values are unboxed machine numbers
+    (typecode 'd' = float, 'q' = int64, ...) instead of a list of objects.
+    push: O(log_d n), pop: O(d log_d n), bulk build: O(n).
+    """
+    def __init__(self, values=(), arity=4, typecode='d'):
+        if arity < 2:
+            raise ValueError('arity must be at least 2')
+        self.arity = arity
+        self.typecode = typecode
+        self.items = _typed_array(values, typecode)
+        self._heapify()
+
+    def __len__(self):
+        return len(self.items)
+
+    def peek(self):
+        if not self.items:
+            raise IndexError('peek from an empty heap')
+        return self.items[0]
+
+    def push(self, value):
+        self.items.append(value)
+        self._sift_up(len(self.items) - 1)
+
+    def pop(self):
+        items = self.items
+        if not items:
+            raise IndexError('pop from an empty heap')
+        last = items.pop()
+        if not items:
+            return last
+        top = items[0]
+        items[0] = last
+        self._sift_down(0)
+        return top
+
+    def push_many(self, values):
+        """
+        Push a batch of values
+        Large batches are appended and the whole heap is rebuilt in O(n + k),
+        small ones are sifted in one by one in O(k log_d n).
+        """
+        values = _typed_array(values, self.typecode)
+        if len(values) > len(self.items):
+            self.items.extend(values)
+            self._heapify()
+        else:
+            for value in values:
+                self.push(value)
+
+    def pop_many(self, k):
+        """The k smallest values in ascending order, removed from the heap."""
+        items = self.items
+        if k >= len(items):
+            result = array(self.typecode, sorted(items))
+            del items[:]
+            return result
+        result = array(self.typecode)
+        for _ in range(k):
+            result.append(self.pop())
+        return result
+
+    def _heapify(self):
+        # Sift down every internal node, deepest first: O(n) in total
+        for i in range((len(self.items) - 2) // self.arity, -1, -1):
+            self._sift_down(i)
+
+    def _sift_up(self, i):
+        items, d = self.items, self.arity
+        value = items[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if items[parent] <= value:
+                break
+            items[i] = items[parent]
+            i = parent
+        items[i] = value
+
+    def _sift_down(self, i):
+        items, d = self.items, self.arity
+        n = len(items)
+        value = items[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            # Smallest of the (up to) d adjacent children
+            child, smallest = first, items[first]
+            for j in range(first + 1, min(first + d, n)):
+                if items[j] < smallest:
+                    child, smallest = j, items[j]
+            if value <= smallest:
+                break
+            items[i] = smallest
+            i = child
+        items[i] = value
+
+
+def _typed_array(values, typecode):
+    """Copy values into a new array(typecode); NumPy arrays go through raw bytes."""
+    if np is not None and isinstance(values, np.ndarray):
+        result = array(typecode)
+        result.frombytes(np.ascontiguousarray(values, dtype=typecode).tobytes())
+        return result
+    return array(typecode, values)
+
+
+class KthStream:
+    """
+    k-th smallest (or largest) element in a stream
+    Keeps only the k best values seen so far in a bounded heap:
+        smallest -> max-heap of the k smallest (values stored negated)
+        largest  -> min-heap of the k largest
+    add: O(log k), kth: O(1), memory: O(k). Values must be numbers.
+    """
+    def __init__(self, k, largest=False):
+        if k < 1:
+            raise ValueError('k must be at least 1')
+        self.k = k
+        self.largest = largest
+        self.heap = []
+
+    def add(self, value):
+        key = value if self.largest else -value
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, key)
+        elif key > self.heap[0]:
+            heapq.heapreplace(self.heap, key)
+        return self.kth
+
+    def extend(self, values):
+        heap, k = self.heap, self.k
+        sign = 1 if self.largest else -1
+        for value in values:
+            key = sign * value
+            if len(heap) < k:
+                heapq.heappush(heap, key)
+            elif key > heap[0]:
+                heapq.heapreplace(heap, key)
+        return self.kth
+
+    @property
+    def kth(self):
+        """Current k-th statistic, None until k values have arrived."""
+        if len(self.heap) < self.k:
+            return None
+        return self.heap[0] if self.largest else -self.heap[0]
+
+
+class WindowedKth:
+    """
+    k-th smallest (or largest) among the last `window` values of a stream
+    Two heaps with lazy deletion:
+        low  -> the k best live values (top = current answer)
+        high -> every other live value
+    Expired entries stay in a heap until they reach its top; the heaps are
+    compacted when dead entries outnumber live ones.
+    add: O(log window) amortized, kth: O(1), memory: O(window).
+    """
+    def __init__(self, k, window, largest=False):
+        if not 1 <= k <= window:
+            raise ValueError('need 1 <= k <= window')
+        self.k = k
+        self.window = window
+        self.sign = -1 if largest else 1
+        self.low = []     # (-key, seq): max-heap on key
+        self.high = []    # (key, seq): min-heap on key
+        self.in_low = {}  # seq -> True if the live value is in low, False if in high
+        self.low_size = 0
+        self.seq = 0
+        self.dead = set()
+
+    def add(self, value):
+        key = self.sign * value
+        seq = self.seq
+        self.seq += 1
+        self._prune()
+        if self.low_size < self.k or key < -self.low[0][0]:
+            heapq.heappush(self.low, (-key, seq))
+            self.in_low[seq] = True
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, (key, seq))
+            self.in_low[seq] = False
+        # Expire the value that just left the window
+        old = seq - self.window
+        if old >= 0:
+            if self.in_low.pop(old):
+                self.low_size -= 1
+            self.dead.add(old)
+        self._rebalance()
+        return self.kth
+
+    def extend(self, values):
+        for value in values:
+            self.add(value)
+        return self.kth
+
+    @property
+    def kth(self):
+        """Current k-th statistic of the window, None until k values are live."""
+        if self.low_size < self.k:
+            return None
+        return self.sign * -self.low[0][0]
+
+    def _prune(self):
+        for heap in (self.low, self.high):
+            while heap and heap[0][1] in self.dead:
+                self.dead.discard(heapq.heappop(heap)[1])
+
+    def _rebalance(self):
+        self._prune()
+        while self.low_size > self.k:
+            neg_key, seq = heapq.heappop(self.low)
+            heapq.heappush(self.high, (-neg_key, seq))
+            self.in_low[seq] = False
+            self.low_size -= 1
+            self._prune()
+        while self.low_size < self.k and len(self.in_low) > self.low_size:
+            key, seq = heapq.heappop(self.high)
+            heapq.heappush(self.low, (-key, seq))
+            self.in_low[seq] = True
+            self.low_size += 1
+            self._prune()
+        if len(self.dead) > self.window:
+            self._compact()
+
+    def _compact(self):
+        dead = self.dead
+        self.low = [entry for entry in self.low if entry[1] not in dead]
+        self.high = [entry for entry in self.high if entry[1] not in dead]
+        heapq.heapify(self.low)
+        heapq.heapify(self.high)
+        dead.clear()
+
+class _SkipNode:
+    __slots__ = ('value', 'next', 'width')
+
+    def __init__(self, value, next, width):
+        self.value = value
+        self.next = next
+        self.width = width
+
+
+class _End:
+    """Sentinel value that compares greater than everything."""
+    def __lt__(self, other):
+        return False
+
+    def __le__(self, other):
+        return False
+
+
+_SKIP_NIL = _SkipNode(_End(), [], [])
+
+
+class IndexableSkiplist:
+    """
+    Sorted multiset with O(log n) insert, remove and index lookup
+    Every link stores its width (how many nodes it skips), so the i-th
+    smallest value is found by walking down the levels while summing widths.
+    """
+    def __init__(self, expected_size=100):
+        self.size = 0
+        self.maxlevels = max(1, int(expected_size).bit_length())
+        self.head = _SkipNode('HEAD', [_SKIP_NIL] * self.maxlevels, [1] * self.maxlevels)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.size:
+            raise IndexError('skiplist index out of range')
+        node = self.head
+        i += 1
+        for level in reversed(range(self.maxlevels)):
+            while node.width[level] <= i:
+                i -= node.width[level]
+                node = node.next[level]
+        return node.value
+
+    def __iter__(self):
+        node = self.head.next[0]
+        while node is not _SKIP_NIL:
+            yield node.value
+            node = node.next[0]
+
+    def insert(self, value):
+        # Last node before value on every level, and the distance walked there
+        chain = [None] * self.maxlevels
+        steps_at_level = [0] * self.maxlevels
+        node = self.head
+        for level in reversed(range(self.maxlevels)):
+            while node.next[level].value <= value:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        # Coin flips pick the height of the new node
+        height = 1
+        while height < self.maxlevels and random.random() < 0.5:
+            height += 1
+        new = _SkipNode(value, [None] * height, [None] * height)
+        steps = 0
+        for level in range(height):
+            prev = chain[level]
+            new.next[level] = prev.next[level]
+            prev.next[level] = new
+            new.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(height, self.maxlevels):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, value):
+        chain = [None] * self.maxlevels
+        node = self.head
+        for level in reversed(range(self.maxlevels)):
+            while node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+        target = chain[0].next[0]
+        if target is _SKIP_NIL or target.value != value:
+            raise KeyError(value)
+        for level in range(len(target.next)):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.next[level] = target.next[level]
+        for level in range(len(target.next), self.maxlevels):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+
+class SlidingWindowStats:
+    """
+    Median, k-th smallest and percentiles over the last `window` values
+    Arrival order is kept in a deque (to know what expires next) and the
+    values themselves in an IndexableSkiplist.
+    add / expire: O(log window), median / kth / percentile: O(log window).
+    """
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError('window must be at least 1')
+        self.window = window
+        self.recent = deque()
+        self.sorted = IndexableSkiplist(window)
+
+    def __len__(self):
+        return len(self.recent)
+
+    def add(self, value):
+        self.recent.append(value)
+        self.sorted.insert(value)
+        if len(self.recent) > self.window:
+            self.sorted.remove(self.recent.popleft())
+
+    def push_many(self, values):
+        """Add a batch of values (any iterable, including NumPy arrays)."""
+        if hasattr(values, 'tolist'):
+            # One conversion to Python numbers instead of per-item NumPy scalars
+            values = values.tolist()
+        for value in values:
+            self.add(value)
+
+    def kth(self, k):
+        """k-th smallest value in the window (1-based)."""
+        if not 1 <= k <= len(self.recent):
+            raise IndexError(f'k={k} out of range for {len(self.recent)} values')
+        return self.sorted[k - 1]
+
+    def median(self):
+        n = len(self.recent)
+        if n == 0:
+            raise IndexError('median of an empty window')
+        if n % 2:
+            return self.sorted[n // 2]
+        return (self.sorted[n // 2 - 1] + self.sorted[n // 2]) / 2
+
+    def percentile(self, p):
+        """Nearest-rank p-th percentile (0 < p <= 100) of the window."""
+        if not 0 < p <= 100:
+            raise ValueError('p must be in (0, 100]')
+        n = len(self.recent)
+        return self.kth(max(1, int(-(-p * n // 100))))
+
 if __name__ == "__main__":
     heap = Heap()
     print(heap.kth_smallest_heap_([3, 2, 1, 5, 6, 4], 2))
     print(heap.kth_smallest_heap_([3, 2, 3, 1,], 10))
-    print(heap.topKFrequent([1,1,1,2,2,3], 2))
\ No newline at end of file
+    print(heap.topKFrequent([1,1,1,2,2,3], 2))
+    print(heap.topKFrequent([1,1,1,2,2,3,4,1,2,5], 2, capacity=3))
+    tasks = IndexedPriorityQueue()
+    for name, priority in [('a', 5), ('b', 3), ('c', 8)]:
+        tasks.push(name, priority)
+    tasks.decrease_key('c', 1)
+    tasks.remove('b')
+    print(tasks.pop(), tasks.pop())
+    dary = DaryHeap([9, 4, 7, 1, 8], arity=4)
+    dary.push_many([3, 6])
+    print(dary.pop(), dary.pop_many(3).tolist(), len(dary))
+    latency = SlidingWindowStats(5)
+    latency.push_many([12, 7, 30, 9, 15, 40, 8])
+    print(latency.median(), latency.percentile(90))
+    stream = KthStream(3, largest=True)
+    print([stream.add(x) for x in [4, 5, 8, 2, 3, 5, 10, 9, 4]])
+    window = WindowedKth(2, 4)
+    print([window.add(x) for x in [5, 1, 4, 2, 8, 7, 6, 3]])
\ No newline at end of file
@@ -0,0 +1,278 @@
+"""
+SHARDED PARALLEL TOP-K
+======================
+
+The input is cut into chunks of `chunk_size` values. Every chunk is
+reduced in a process pool to a small mergeable partial result, and the
+parent merges the partials:
+
+    nsmallest / nlargest / kth -> each worker keeps its k best values
+                                  (bounded heap, sorted), the parent
+                                  k-way merges the sorted partials
+    topKFrequent               -> each worker counts its chunk, the parent
+                                  adds the counts up in chunk order
+
+How chunks reach the workers:
+    array.array / NumPy array -> copied once into shared memory; workers
+                                 attach by name and view their slice
+    FileArray                 -> raw typed-value file (e.g. a run written
+                                 by external_sort), workers mmap their slice
+    any other sequence        -> the slice is pickled to the worker
+
+Results are the same as the single-core functions in heap.py: counts are
+added in chunk order, so items keep their first-occurrence order and ties
+are broken exactly like Heap.topKFrequent does. The only exception is the
+bounded-memory `capacity` mode, which is an estimate on both paths.
+"""
+from array import array
+from collections import Counter
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import islice
+from multiprocessing import resource_tracker, shared_memory
+import heapq
+import mmap
+import os
+
+from heap import (SpaceSaving, _top_k_frequent_buckets,
+                  _top_k_from_unique_counts, np)
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class FileArray:
+    """A file of raw typed values (array.tofile layout), read through mmap."""
+    def __init__(self, path, typecode='q'):
+        self.path = path
+        self.typecode = typecode
+        self.itemsize = array(typecode).itemsize
+
+    def __len__(self):
+        return os.path.getsize(self.path) // self.itemsize
+
+
+# WORKER SIDE
+def _is_numpy(values):
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _chunk_smallest(values, k, largest=False):
+    """k smallest (or largest) values of one chunk, sorted best first."""
+    if _is_numpy(values):
+        if k < len(values):
+            kth = len(values) - k if largest else k - 1
+            part = np.partition(values, kth)
+            values = part[kth:] if largest else part[:k]
+        values = np.sort(values)
+        return (values[::-1] if largest else values).tolist()
+    return heapq.nlargest(k, values) if largest else heapq.nsmallest(k, values)
+
+
+def _chunk_counts(values, capacity):
+    """Frequency summary of one chunk."""
+    if capacity is not None:
+        summary = SpaceSaving(capacity)
+        summary.update_many(values)
+        return summary
+    if _is_numpy(values) and values.dtype.kind in 'iub':
+        return np.unique(values, return_counts=True)
+    return Counter(values)
+
+
+_CHUNK_OPS = {
+    'nsmallest': lambda values, k: _chunk_smallest(values, k),
+    'nlargest': lambda values, k: _chunk_smallest(values, k, largest=True),
+    'counts': _chunk_counts,
+}
+
+
+def _with_chunk(source, fn):
+    """Call fn on the values a chunk descriptor points to, then release them."""
+    kind = source[0]
+    if kind == 'values':
+        return fn(source[1])
+    if kind == 'shm':
+        _, name, layout, start, stop = source
+        handle = shared_memory.SharedMemory(name=name)
+        buf = handle.buf
+    else:
+        _, path, layout, start, stop = source
+        with open(path, 'rb') as fp:
+            handle = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(handle)
+    try:
+        if layout[0] == 'numpy':
+            dtype = np.dtype(layout[1])
+            view = np.frombuffer(buf, dtype, stop - start, start * dtype.itemsize)
+            try:
+                return fn(view)
+            finally:
+                del view
+        itemsize = array(layout[1]).itemsize
+        raw = buf[start * itemsize:stop * itemsize]
+        view = raw.cast(layout[1])
+        try:
+            return fn(view)
+        finally:
+            view.release()
+            raw.release()
+    finally:
+        if kind == 'file':
+            buf.release()
+        handle.close()
+
+
+def _chunk_task(task):
+    """Worker: apply one chunk operation to one chunk."""
+    op, source, arg = task
+    return _with_chunk(source, lambda values: _CHUNK_OPS[op](values, arg))
+
+
+class ParallelTopK:
+    def __init__(self, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        processes: pool size (default: os.cpu_count())
+        chunk_size: values per chunk; inputs no longer than one chunk are
+                    handled in the calling process
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool = None
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _map(self, op, nums, arg):
+        """Partial results of op for every chunk of nums, in chunk order."""
+        n = len(nums)
+        bounds = [(start, min(start + self.chunk_size, n))
+                  for start in range(0, n, self.chunk_size)]
+        if isinstance(nums, FileArray):
+            layout = ('array', nums.typecode)
+            tasks = [(op, ('file', nums.path, layout, start, stop), arg)
+                     for start, stop in bounds]
+            return self._run(tasks)
+        if len(bounds) <= 1:
+            return [_CHUNK_OPS[op](nums, arg)] if n else []
+        if _is_numpy(nums) or isinstance(nums, array):
+            # One copy into shared memory instead of pickling every chunk
+            data = memoryview(np.ascontiguousarray(nums) if _is_numpy(nums) else nums)
+            layout = ('numpy', nums.dtype.str) if _is_numpy(nums) else ('array', nums.typecode)
+            shm = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+            try:
+                shm.buf[:data.nbytes] = data.cast('B')
+                data.release()
+                tasks = [(op, ('shm', shm.name, layout, start, stop), arg)
+                         for start, stop in bounds]
+                return self._run(tasks)
+            finally:
+                shm.close()
+                shm.unlink()
+        tasks = [(op, ('values', nums[start:stop]), arg) for start, stop in bounds]
+        return self._run(tasks)
+
+    def _run(self, tasks):
+        if len(tasks) == 1:
+            return [_chunk_task(tasks[0])]
+        if self._pool is None:
+            # Workers must share the parent's tracker, otherwise each one
+            # tracks the segments it attaches to and "cleans" them at exit
+            resource_tracker.ensure_running()
+            self._pool = ProcessPoolExecutor(self.processes)
+        return list(self._pool.map(_chunk_task, tasks))
+
+    # PARALLEL OPERATIONS (same results as the single-core versions)
+    def nsmallest(self, nums, k):
+        """
+        k smallest values in ascending order, like heapq.nsmallest
+        Time Complexity: O(c log k) per chunk of c values, O(p k log p) merge for p chunks
+        Space Complexity: O(p k) in the parent
+        """
+        if k <= 0:
+            return []
+        partials = self._map('nsmallest', nums, k)
+        return list(islice(heapq.merge(*partials), k))
+
+    def nlargest(self, nums, k):
+        """
+        k largest values in descending order, like heapq.nlargest
+        Time Complexity: O(c log k) per chunk of c values, O(p k log p) merge for p chunks
+        """
+        if k <= 0:
+            return []
+        partials = self._map('nlargest', nums, k)
+        return list(islice(heapq.merge(*partials, reverse=True), k))
+
+    def kth_smallest(self, nums, k):
+        """
+        k-th smallest (1-based), like Heap.kth_smallest
+        Works from whichever end is closer, so workers keep min(k, n - k + 1)
+        values each; best when that is small compared to chunk_size.
+        """
+        n = len(nums)
+        if not 1 <= k <= n:
+            raise ValueError(f'k={k} out of range for {n} values')
+        if k <= n - k + 1:
+            return self.nsmallest(nums, k)[-1]
+        return self.nlargest(nums, n - k + 1)[-1]
+
+    def topKFrequent(self, nums, k, capacity=None):
+        """
+        k most frequent items as a deque, most frequent first, like
+        Heap.topKFrequent (including its tie order). With capacity, every
+        chunk builds a SpaceSaving summary and the summaries are merged.
+        Time Complexity: O(c) per chunk of c values, O(u) merge for u distinct items
+        """
+        return deque(self._top_k_frequent(nums, k, capacity))
+
+    def _top_k_frequent(self, nums, k, capacity):
+        if k <= 0:
+            return []
+        partials = self._map('counts', nums, capacity)
+        if not partials:
+            return []
+        if capacity is not None:
+            summary = reduce(SpaceSaving.merge, partials)
+            return [item for item, _, _ in summary.top(k)]
+        if isinstance(partials[0], tuple):
+            # NumPy unique counts: re-unique the chunk values and add their counts
+            values, inverse = np.unique(np.concatenate([v for v, _ in partials]),
+                                        return_inverse=True)
+            counts = np.zeros(len(values), dtype=np.intp)
+            np.add.at(counts, inverse, np.concatenate([c for _, c in partials]))
+            return _top_k_from_unique_counts(values, counts, k)
+        counted = Counter()
+        for partial in partials:
+            counted.update(partial)
+        return _top_k_frequent_buckets(counted, k)
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+
+    from heap import Heap
+
+    nums = array('q', (random.randint(0, 10 ** 6) for _ in range(200000)))
+    freq = [random.randint(0, 50) for _ in range(200000)]
+    helper = Heap()
+    with ParallelTopK(processes=4, chunk_size=25000) as pool:
+        print("5 smallest:", pool.nsmallest(nums, 5), pool.nsmallest(nums, 5) == heapq.nsmallest(5, nums))
+        print("5 largest:", pool.nlargest(nums, 5))
+        print("1000th smallest:", pool.kth_smallest(nums, 1000), helper.kth_smallest(nums, 1000))
+        print("top 5 frequent:", pool.topKFrequent(freq, 5), helper.topKFrequent(freq, 5))
+        with tempfile.NamedTemporaryFile(suffix='.run') as fp:
+            nums.tofile(fp)
+            fp.flush()
+            print("file 5 smallest:", pool.nsmallest(FileArray(fp.name, 'q'), 5))
@@ -108,15 +108,25 @@ Hard:
 6. IMPLEMENTATION TEMPLATES
 --------------------------
 """
+from collections import deque
+
+# Binary serialization format (see TreeNode.serialize_binary)
+BINARY_MAGIC = b'TRB1'
+BINARY_BLOCK_SIZE = 4096
 
 # TreeNode class definition
 class TreeNode:
+    # __slots__ drops the per-node __dict__, roughly halving the size of each node
+    __slots__ = ('value', 'left', 'right')
+
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
 
     # 1. DFS TRAVERSAL TEMPLATES
+    # The list versions are thin wrappers over lazy generators that use an
+    # explicit stack, so a skewed tree never hits the recursion limit.
     def inorder_traversal(self, root, result=None):
         """
         Inorder Traversal (Left → Root → Right)
@@ -125,10 +135,7 @@ class TreeNode:
         """
         if result is None:
             result = []
-        if root:
-            self.inorder_traversal(root.left, result)
-            result.append(root.value)
-            self.inorder_traversal(root.right, result)
+        result.extend(self.iter_inorder(root))
         return result
 
     def preorder_traversal(self, root, result=None):
@@ -139,10 +146,7 @@ class TreeNode:
         """
         if result is None:
             result = []
-        if root:
-            result.append(root.value)
-            self.preorder_traversal(root.left, result)
-            self.preorder_traversal(root.right, result)
+        result.extend(self.iter_preorder(root))
         return result
 
     def postorder_traversal(self, root, result=None):
@@ -153,30 +157,144 @@ class TreeNode:
         """
         if result is None:
             result = []
-        if root:
-            self.postorder_traversal(root.left, result)
-            self.postorder_traversal(root.right, result)
-            result.append(root.value)
+        result.extend(self.iter_postorder(root))
         return result
 
+    def iter_inorder(self, root):
+        """
+        Lazy Inorder Traversal with an explicit stack
+        Time Complexity: O(n)
+        Space Complexity: O(h)
+        """
+        stack = []
+        node = root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def iter_preorder(self, root):
+        """
+        Lazy Preorder Traversal with an explicit stack
+        Time Complexity: O(n)
+        Space Complexity: O(h)
+        """
+        stack = [root] if root else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_postorder(self, root):
+        """
+        Lazy Postorder Traversal with an explicit stack
+        Every node is pushed twice: first to expand its children, then
+        (flagged) to emit it once both subtrees are done. Unlike a
+        "last emitted node" check this also works when subtrees are shared.
+        Time Complexity: O(n)
+        Space Complexity: O(h)
+        """
+        stack = [(root, False)] if root else []
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                yield node.value
+                continue
+            stack.append((node, True))
+            if node.right:
+                stack.append((node.right, False))
+            if node.left:
+                stack.append((node.left, False))
+
+    def morris_inorder(self, root):
+        """
+        Morris Inorder Traversal
+        Temporarily threads each inorder predecessor back to its successor
+        instead of keeping a stack. The tree is restored when the walk ends,
+        also when the consumer stops early.
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+        walk = self._morris_walk(root, preorder=False)
+        try:
+            for node in walk:
+                yield node.value
+        finally:
+            # Finish the walk silently so every temporary thread is removed
+            for _ in walk:
+                pass
+
+    def morris_preorder(self, root):
+        """
+        Morris Preorder Traversal
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+        walk = self._morris_walk(root, preorder=True)
+        try:
+            for node in walk:
+                yield node.value
+        finally:
+            for _ in walk:
+                pass
+
+    def _morris_walk(self, root, preorder):
+        node = root
+        while node:
+            if node.left is None:
+                yield node
+                node = node.right
+                continue
+            pred = node.left
+            while pred.right and pred.right is not node:
+                pred = pred.right
+            if pred.right is None:
+                # First visit: thread predecessor back to node, go left
+                if preorder:
+                    yield node
+                pred.right = node
+                node = node.left
+            else:
+                # Second visit: left subtree done, remove the thread
+                pred.right = None
+                if not preorder:
+                    yield node
+                node = node.right
+
     # 2. BFS TRAVERSAL TEMPLATE
-    def levelorder_traversal(self, root):
+    # The level-order operations below are built on iter_levels, which uses
+    # a deque (O(1) popleft) instead of list.pop(0) (O(n) per dequeue).
+    # Vertical order walks its own level lists, see _vertical_columns.
+    def iter_levels(self, root):
         """
-        Level Order Traversal (BFS)
+        Shared BFS Engine
+        Lazily yields the list of nodes on each level, top to bottom
         Time Complexity: O(n)
         Space Complexity: O(w) where w is max width
         """
-        result = []
-        if root:
-            queue = [root]
-            while queue:
-                node = queue.pop(0)
-                result.append(node.value)
+        queue = deque([root] if root else [])
+        while queue:
+            level = [queue.popleft() for _ in range(len(queue))]
+            for node in level:
                 if node.left:
                     queue.append(node.left)
                 if node.right:
                     queue.append(node.right)
-        return result
+            yield level
+
+    def levelorder_traversal(self, root):
+        """
+        Level Order Traversal (BFS)
+        Time Complexity: O(n)
+        Space Complexity: O(w) where w is max width
+        """
+        return [node.value for level in self.iter_levels(root) for node in level]
 
     def levelorder_traversal_with_levels(self, root):
         """
@@ -190,28 +308,7 @@ class TreeNode:
         Time Complexity: O(n)
         Space Complexity: O(w) where w is max width
         """
-        if not root:
-            return []
-            
-        result = []
-        queue = [root]
-        
-        while queue:
-            level_size = len(queue)
-            current_level = []
-            
-            for _ in range(level_size):
-                node = queue.pop(0)
-                current_level.append(node.value)
-                
-                if node.left:
-                    queue.append(node.left)
-                if node.right:
-                    queue.append(node.right)
-            
-            result.append(current_level)
-        
-        return result
+        return [[node.value for node in level] for level in self.iter_levels(root)]
 
     def right_side_view(self, root):
         """
@@ -221,28 +318,8 @@ class TreeNode:
         Time Complexity: O(n)
         Space Complexity: O(w) where w is max width
         """
-        if not root:
-            return []
-            
-        result = []
-        queue = [root]
-        
-        while queue:
-            level_size = len(queue)
-            
-            for i in range(level_size):
-                node = queue.pop(0)
-                
-                # If it's the last node in the level, add to result
-                if i == level_size - 1:
-                    result.append(node.value)
-                
-                if node.left:
-                    queue.append(node.left)
-                if node.right:
-                    queue.append(node.right)
-        
-        return result
+        # The last node in each level is visible from the right
+        return [level[-1].value for level in self.iter_levels(root)]
 
     def left_side_view(self, root):
         """
@@ -252,28 +329,8 @@ class TreeNode:
         Time Complexity: O(n)
         Space Complexity: O(w) where w is max width
         """
-        if not root:
-            return []
-            
-        result = []
-        queue = [root]
-        
-        while queue:
-            level_size = len(queue)
-            
-            for i in range(level_size):
-                node = queue.pop(0)
-                
-                # If it's the first node in the level, add to result
-                if i == 0:
-                    result.append(node.value)
-                
-                if node.left:
-                    queue.append(node.left)
-                if node.right:
-                    queue.append(node.right)
-        
-        return result
+        # The first node in each level is visible from the left
+        return [level[0].value for level in self.iter_levels(root)]
 
     def zigzag_level_order(self, root):
         """
@@ -283,36 +340,56 @@ class TreeNode:
         Time Complexity: O(n)
         Space Complexity: O(w) where w is max width
         """
-        if not root:
-            return []
-            
         result = []
-        queue = [root]
-        left_to_right = True
-        
-        while queue:
-            level_size = len(queue)
-            current_level = []
-            
-            for _ in range(level_size):
-                node = queue.pop(0)
-                
-                # Add to current level based on direction
-                if left_to_right:
-                    current_level.append(node.value)
-                else:
-                    current_level.insert(0, node.value)
-                
-                if node.left:
-                    queue.append(node.left)
-                if node.right:
-                    queue.append(node.right)
-            
+        for depth, level in enumerate(self.iter_levels(root)):
+            current_level = [node.value for node in level]
+            # Odd levels read right to left
+            if depth % 2:
+                current_level.reverse()
             result.append(current_level)
-            left_to_right = not left_to_right
-        
         return result
 
+    TREE_VIEWS = ('levels', 'right', 'left', 'zigzag', 'depth')
+
+    def tree_views(self, root, views=TREE_VIEWS):
+        """
+        Multi-View Report in a Single BFS Pass
+        Computes any subset of:
+            'levels' -> levelorder_traversal_with_levels
+            'right'  -> right_side_view
+            'left'   -> left_side_view
+            'zigzag' -> zigzag_level_order
+            'depth'  -> maxDepth
+        and returns them in a dict keyed by view name.
+
+        Time Complexity: O(n) for all views together
+        Space Complexity: O(w) plus the size of the requested views
+        """
+        unknown = set(views) - set(self.TREE_VIEWS)
+        if unknown:
+            raise ValueError(f'unknown tree views: {sorted(unknown)}')
+        want_levels = 'levels' in views
+        want_zigzag = 'zigzag' in views
+        report = {name: [] for name in views if name != 'depth'}
+
+        depth = 0
+        for depth, level in enumerate(self.iter_levels(root), 1):
+            if want_levels or want_zigzag:
+                values = [node.value for node in level]
+                if want_levels:
+                    report['levels'].append(values)
+                if want_zigzag:
+                    # Odd levels (0-based) read right to left
+                    report['zigzag'].append(values[::-1] if depth % 2 == 0 else values)
+            if 'right' in report:
+                report['right'].append(level[-1].value)
+            if 'left' in report:
+                report['left'].append(level[0].value)
+
+        if 'depth' in views:
+            report['depth'] = depth
+        return report
+
     def vertical_order_traversal(self, root):
         """
         Vertical Order Traversal
@@ -321,86 +398,66 @@ class TreeNode:
         Time Complexity: O(n)
         Space Complexity: O(n)
         """
-        if not root:
-            return []
-            
-        # Dictionary to store nodes by their horizontal distance
-        vertical_map = {}
-        # Queue to store (node, horizontal_distance)
-        queue = [(root, 0)]
-        min_hd = max_hd = 0
-        
-        while queue:
-            node, hd = queue.pop(0)
-            
-            # Update min and max horizontal distances
-            min_hd = min(min_hd, hd)
-            max_hd = max(max_hd, hd)
-            
-            # Add node to the corresponding horizontal distance list
-            if hd not in vertical_map:
-                vertical_map[hd] = []
-            vertical_map[hd].append(node.value)
-            
-            # Add children to queue with updated horizontal distances
-            if node.left:
-                queue.append((node.left, hd - 1))
-            if node.right:
-                queue.append((node.right, hd + 1))
-        
-        # Construct result by traversing from left to right
-        result = []
-        for hd in range(min_hd, max_hd + 1):
-            if hd in vertical_map:
-                result.append(vertical_map[hd])
-        
-        return result
+        return self._vertical_columns(root)
 #https://www.youtube.com/watch?v=-JFngYs21Y8
     def vertical_order_traversal_with_levels(self, root):
         """
         Vertical Order Traversal with Level Information
         Returns nodes in vertical order, and for same vertical line,
         nodes are ordered by their levels (top to bottom)
+
+        BFS already emits nodes level by level (left to right within a
+        level), so appending in BFS order leaves every column sorted by
+        level and no per-column sort is needed.
         
-        Time Complexity: O(n log n) due to sorting
+        Time Complexity: O(n)
         Space Complexity: O(n)
         """
+        return self._vertical_columns(root)
+
+    def _vertical_columns(self, root):
+        """
+        Shared vertical order engine
+        1. Width pass: find the leftmost and rightmost horizontal distance
+        2. BFS pass: append each value to columns[hd - min_hd]
+        Horizontal distances travel in lists parallel to the nodes, so no
+        dict lookups or (node, hd, level) tuples are created.
+        """
         if not root:
             return []
-            
-        # Dictionary to store nodes by their horizontal distance
-        vertical_map = {}
-        # Queue to store (node, horizontal_distance, level)
-        queue = [(root, 0, 0)]
+
+        # 1. Width pass (iterative DFS)
         min_hd = max_hd = 0
-        
-        while queue:
-            node, hd, level = queue.pop(0)
-            
-            # Update min and max horizontal distances
-            min_hd = min(min_hd, hd)
-            max_hd = max(max_hd, hd)
-            
-            # Add node to the corresponding horizontal distance list
-            if hd not in vertical_map:
-                vertical_map[hd] = []
-            vertical_map[hd].append((level, node.value))
-            
-            # Add children to queue with updated horizontal distances and levels
+        nodes, hds = [root], [0]
+        while nodes:
+            node, hd = nodes.pop(), hds.pop()
+            if hd < min_hd:
+                min_hd = hd
+            elif hd > max_hd:
+                max_hd = hd
             if node.left:
-                queue.append((node.left, hd - 1, level + 1))
+                nodes.append(node.left)
+                hds.append(hd - 1)
             if node.right:
-                queue.append((node.right, hd + 1, level + 1))
-        
-        # Construct result by traversing from left to right
-        result = []
-        for hd in range(min_hd, max_hd + 1):
-            if hd in vertical_map:
-                # Sort by level and extract values
-                vertical_map[hd].sort(key=lambda x: x[0])
-                result.append([val for _, val in vertical_map[hd]])
-        
-        return result
+                nodes.append(node.right)
+                hds.append(hd + 1)
+
+        # 2. BFS pass, one level at a time; every column between min_hd and
+        # max_hd is non-empty because hd moves by one per edge
+        columns = [[] for _ in range(max_hd - min_hd + 1)]
+        nodes, cols = [root], [-min_hd]
+        while nodes:
+            next_nodes, next_cols = [], []
+            for node, col in zip(nodes, cols):
+                columns[col].append(node.value)
+                if node.left:
+                    next_nodes.append(node.left)
+                    next_cols.append(col - 1)
+                if node.right:
+                    next_nodes.append(node.right)
+                    next_cols.append(col + 1)
+            nodes, cols = next_nodes, next_cols
+        return columns
 
     def sumNumbers(self, root):
         """
@@ -419,21 +476,24 @@ class TreeNode:
         Time Complexity: O(n)
         Space Complexity: O(h) where h is height of tree
         """
-        def dfs(node, current_sum):
-            if not node:
-                return 0
-                
+        total = 0
+        # Stack of (node, number formed by the path above the node)
+        stack = [(root, 0)] if root else []
+        while stack:
+            node, current_sum = stack.pop()
             # Update current sum by multiplying by 10 and adding current node value
             current_sum = current_sum * 10 + node.value
-            
-            # If leaf node, return the current sum
+
+            # If leaf node, the path number is complete
             if not node.left and not node.right:
-                return current_sum
-                
-            # Recursively get sum from left and right subtrees
-            return dfs(node.left, current_sum) + dfs(node.right, current_sum)
-        
-        return dfs(root, 0)
+                total += current_sum
+                continue
+
+            if node.right:
+                stack.append((node.right, current_sum))
+            if node.left:
+                stack.append((node.left, current_sum))
+        return total
 
     # TREE CONSTRUCTION PATTERNS
     def buildTree_from_inorder_preorder(self, inorder, preorder):
@@ -502,36 +562,44 @@ class TreeNode:
     def buildTree_from_levelorder_inorder(self, levelorder, inorder):
         """
         Construct Binary Tree from Level Order and Inorder Traversal
-        
-        Time Complexity: O(n²)
+
+        The parent of a node is its nearest inorder neighbour (predecessor or
+        successor) among the nodes that come before it in level order,
+        whichever of the two comes later in level order. Removing nodes from
+        a linked list of inorder ranks in reverse level order exposes exactly
+        those neighbours, one O(1) unlink per node and no recursion.
+
+        Time Complexity: O(n)
         Space Complexity: O(n)
         """
+        n = len(inorder)
+        if not levelorder or n == 0:
+            return None
         inorder_map = {val: idx for idx, val in enumerate(inorder)}
-        
-        def build_tree(level, in_left, in_right):
-            if not level or in_left > in_right:
-                return None
-                
-            # Find the first node in level order that appears in inorder
-            root_val = None
-            for val in level:
-                if in_left <= inorder_map[val] <= in_right:
-                    root_val = val
-                    break
-            
-            if root_val is None:
-                return None
-                
-            root = TreeNode(root_val)
-            root_idx = inorder_map[root_val]
-            
-            # Build left and right subtrees
-            root.left = build_tree(level, in_left, root_idx - 1)
-            root.right = build_tree(level, root_idx + 1, in_right)
-            
-            return root
-        
-        return build_tree(levelorder, 0, len(inorder) - 1)
+        ranks = [inorder_map[val] for val in levelorder]
+        # Position of each inorder rank in the level order
+        level_pos = [0] * n
+        for pos, rank in enumerate(ranks):
+            level_pos[rank] = pos
+
+        # Doubly linked list over inorder ranks, -1 and n are the ends
+        prev = list(range(-1, n - 1))
+        nxt = list(range(1, n + 1))
+        nodes = [TreeNode(val) for val in inorder]
+        for pos in range(len(ranks) - 1, 0, -1):
+            rank = ranks[pos]
+            before, after = prev[rank], nxt[rank]
+            if after == n or (before != -1 and level_pos[before] > level_pos[after]):
+                nodes[before].right = nodes[rank]
+            else:
+                nodes[after].left = nodes[rank]
+            # Unlink so earlier nodes see their own nearest neighbours
+            if before != -1:
+                nxt[before] = after
+            if after != n:
+                prev[after] = before
+
+        return nodes[ranks[0]]
 
     def sortedArrayToBST(self, nums):
         """
@@ -558,6 +626,108 @@ class TreeNode:
         
         return build_tree(0, len(nums) - 1)
 
+    def sortedIterToBST(self, iterable, length=None):
+        """
+        Streaming Bulk Load of a Balanced BST from a sorted iterable
+        Never indexes or copies the input, and never recurses.
+
+        Known length: the same shape as sortedArrayToBST (height-balanced).
+            The empty shape is built first with an explicit stack, then
+            an inorder walk fills in the values as they stream in.
+        Unknown length: the nodes are chained into a right-leaning list
+            as the values stream in. Once n is known the same nodes are
+            relinked into the sortedArrayToBST shape, so both paths give
+            the same height-balanced tree.
+
+        Time Complexity: O(n)
+        Space Complexity: O(log n) besides the tree itself
+        """
+        if length is None and hasattr(iterable, '__len__'):
+            length = len(iterable)
+        if length is None:
+            return self._bulk_load_unknown_length(iterable)
+
+        # 1. Empty shape, split at the middle like sortedArrayToBST
+        holder = TreeNode(None)
+        stack = [(0, length - 1, holder, True)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            node = TreeNode(None)
+            if is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((mid + 1, hi, node, False))
+            stack.append((lo, mid - 1, node, True))
+
+        # 2. Inorder visits the slots in sorted order
+        values = iter(iterable)
+        stack = []
+        node = holder.left
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            try:
+                node.value = next(values)
+            except StopIteration:
+                raise ValueError(f'iterable has fewer than {length} items') from None
+            node = node.right
+        return holder.left
+
+    def _bulk_load_unknown_length(self, iterable):
+        head = TreeNode(None)
+        tail = head
+        n = 0
+        for value in iterable:
+            tail.right = TreeNode(value)
+            tail = tail.right
+            n += 1
+        return self._link_balanced(self._iter_vine(head.right), n)
+
+    def _iter_vine(self, node):
+        # Read node.right before handing the node out, it is relinked next
+        while node:
+            nxt = node.right
+            yield node
+            node = nxt
+
+    def _link_balanced(self, nodes, count):
+        """
+        Relink count nodes, given in inorder, into the sortedArrayToBST shape
+        An explicit stack replaces the recursion build(lo, mid - 1),
+        take the next node as root, build(mid + 1, hi).
+        Time Complexity: O(n)
+        Space Complexity: O(log n)
+        """
+        built = None
+        stack = [[0, count - 1, 0, None]]  # lo, hi, phase, root
+        while stack:
+            frame = stack[-1]
+            lo, hi, phase, root = frame
+            if lo > hi:
+                stack.pop()
+                built = None
+                continue
+            mid = (lo + hi) // 2
+            if phase == 0:
+                frame[2] = 1
+                stack.append([lo, mid - 1, 0, None])
+            elif phase == 1:
+                root = next(nodes)
+                root.left = built
+                frame[2], frame[3] = 2, root
+                stack.append([mid + 1, hi, 0, None])
+            else:
+                root.right = built
+                built = root
+                stack.pop()
+        return built
+
     def buildTree_from_levelorder(self, levelorder):
         """
         Construct Binary Tree from Level Order Array
@@ -571,11 +741,11 @@ class TreeNode:
             
         # Create root node
         root = TreeNode(levelorder[0])
-        queue = [root]
+        queue = deque([root])
         i = 1
         
         while queue and i < len(levelorder):
-            node = queue.pop(0)
+            node = queue.popleft()
             
             # Left child
             if i < len(levelorder) and levelorder[i] != -1:
@@ -598,9 +768,17 @@ class TreeNode:
         Time Complexity: O(n)
         Space Complexity: O(h)
         """
-        if not root:
-            return 0
-        return 1 + max(self.maxDepth(root.left), self.maxDepth(root.right))
+        best = 0
+        stack = [(root, 1)] if root else []
+        while stack:
+            node, depth = stack.pop()
+            if depth > best:
+                best = depth
+            if node.left:
+                stack.append((node.left, depth + 1))
+            if node.right:
+                stack.append((node.right, depth + 1))
+        return best
 
     def isBalanced(self, root):
         """
@@ -610,16 +788,26 @@ class TreeNode:
             - Best case (balanced tree): O(log n)
             - Worst case (skewed tree): O(n)
         """
-        def height(root):
-            if not root:
-                return 0
-            left = height(root.left)
-            right = height(root.right)
-            if left == -1 or right == -1 or abs(left - right) > 1:
-                return -1
-            return 1 + max(left, right)
-        
-        return height(root) != -1
+        # Postorder walk: a node's height is known once both children are
+        # done. Heights go on a value stack, not a dict keyed by node, so a
+        # subtree shared by several parents (deduplicated DAG) also works.
+        heights = []
+        stack = [(root, False)] if root else []
+        while stack:
+            node, expanded = stack.pop()
+            if not expanded:
+                stack.append((node, True))
+                if node.right:
+                    stack.append((node.right, False))
+                if node.left:
+                    stack.append((node.left, False))
+                continue
+            right = heights.pop() if node.right else 0
+            left = heights.pop() if node.left else 0
+            if abs(left - right) > 1:
+                return False
+            heights.append(1 + max(left, right))
+        return True
 
     # 4. PATH SUM TEMPLATE
     def hasPathSum(self, root, targetSum):
@@ -628,12 +816,20 @@ class TreeNode:
         Time Complexity: O(n)
         Space Complexity: O(h)
         """
-        if not root:
-            return False
-        if not root.left and not root.right:
-            return targetSum == root.value
-        return (self.hasPathSum(root.left, targetSum - root.value) or
-                self.hasPathSum(root.right, targetSum - root.value))
+        # Stack of (node, sum still needed from this node down)
+        stack = [(root, targetSum)] if root else []
+        while stack:
+            node, remaining = stack.pop()
+            remaining -= node.value
+            if not node.left and not node.right:
+                if remaining == 0:
+                    return True
+                continue
+            if node.right:
+                stack.append((node.right, remaining))
+            if node.left:
+                stack.append((node.left, remaining))
+        return False
 
     # 5. BST VALIDATION TEMPLATE
     def isValidBST(self, root):
@@ -642,56 +838,89 @@ class TreeNode:
         Time Complexity: O(n)
         Space Complexity: O(h)
         """
-        def validate(node, low=float('-inf'), high=float('inf')):
-            if not node:
-                return True
+        # Stack of (node, low, high) bounds the node value must fall between
+        stack = [(root, float('-inf'), float('inf'))] if root else []
+        while stack:
+            node, low, high = stack.pop()
             if node.value <= low or node.value >= high:
                 return False
-            return (validate(node.left, low, node.value) and
-                    validate(node.right, node.value, high))
-        
-        return validate(root)
+            if node.right:
+                stack.append((node.right, node.value, high))
+            if node.left:
+                stack.append((node.left, low, node.value))
+        return True
 
     # 6. LCA TEMPLATE https://www.youtube.com/watch?v=Oi3_06ultic
     def lowestCommonAncestor(self, root, p, q):
         """
         Lowest Common Ancestor
         Time Complexity: O(n)
-        Space Complexity: O(h)
+        Space Complexity: O(n)
         """
-        if not root or root == p or root == q:
-            return root
-        
-        left = self.lowestCommonAncestor(root.left, p, q)
-        right = self.lowestCommonAncestor(root.right, p, q)
-        
-        if left and right:
+        # Record parents until both nodes are found; like the recursive
+        # version, the search does not continue below p or q.
+        if not root or root is p or root is q:
             return root
-        return left or right
+        parent = {root: None}
+        found = []
+        stack = [root]
+        while stack and len(found) < 2:
+            node = stack.pop()
+            for child in (node.left, node.right):
+                if child:
+                    parent[child] = node
+                    if child is p or child is q:
+                        found.append(child)
+                    else:
+                        stack.append(child)
+        if len(found) < 2:
+            # Only one of them is in the tree (or neither)
+            return found[0] if found else None
+
+        # Walk up from the first node, then from the second until the paths meet
+        ancestors = set()
+        node = found[0]
+        while node:
+            ancestors.add(node)
+            node = parent[node]
+        node = found[1]
+        while node not in ancestors:
+            node = parent[node]
+        return node
     def lowestCommonAncestor_in_BST(self, root, p, q):
         """
         Lowest Common Ancestor in BST
         Time Complexity: O(h) where h is height of tree
-        Space Complexity: O(h)
+        Space Complexity: O(1)
         """
-        if not root:    
-            return None
-        if root.value > p.value and root.value > q.value:
-            return self.lowestCommonAncestor_in_BST(root.left, p, q)
-        if root.value < p.value and root.value < q.value:
-            return self.lowestCommonAncestor_in_BST(root.right, p, q)
-        return root
+        while root:
+            if root.value > p.value and root.value > q.value:
+                root = root.left
+            elif root.value < p.value and root.value < q.value:
+                root = root.right
+            else:
+                return root
+        return None
 
     # 7. SERIALIZATION TEMPLATE
     def serialize(self, root):
         """
         Serialize Binary Tree
+        Preorder tokens '#<value>' with 'null' for missing children
         Time Complexity: O(n)
         Space Complexity: O(n)
         """
-        if not root:
-            return 'null'
-        return f'#{root.value} {self.serialize(root.left)} {self.serialize(root.right)}'
+        tokens = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if not node:
+                tokens.append('null')
+                continue
+            tokens.append(f'#{node.value}')
+            stack.append(node.right)
+            stack.append(node.left)
+        return ' '.join(tokens)
 
     def deserialize(self, data):
         """
@@ -699,22 +928,143 @@ class TreeNode:
         Time Complexity: O(n)
         Space Complexity: O(n)
         """
-        if data == 'null':
-            return None
-        data = data.split()
-        
-        def build():
-            if not data:
-                return None
-            val = data.pop(0)
-            if val == 'null':
-                return None
-            node = TreeNode(int(val[1:]))
-            node.left = build()
-            node.right = build()
-            return node
-        
-        return build()
+        # Stack of empty child slots in preorder: (parent, is_left)
+        holder = TreeNode(None)
+        stack = [(holder, True)]
+        for token in data.split():
+            if not stack:
+                break
+            parent, is_left = stack.pop()
+            if token == 'null':
+                continue
+            node = TreeNode(int(token[1:]))
+            if is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((node, False))
+            stack.append((node, True))
+        return holder.left
+
+    def serialize_binary(self, root, fp, block_size=BINARY_BLOCK_SIZE):
+        """
+        Serialize Binary Tree to a binary file object
+        Compact format: nodes in preorder, written in blocks of
+            varint(count) varint(payload length)
+            payload = structure bitmap (2 bits per node: has left, has right)
+                      + zigzag varint of each value
+        and a count of 0 marks the end. Values must be integers.
+        Time Complexity: O(n)
+        Space Complexity: O(h + block_size)
+        """
+        fp.write(BINARY_MAGIC)
+        flags, values = [], []
+        stack = [root] if root else []
+        while stack:
+            node = stack.pop()
+            flags.append((node.left is not None, node.right is not None))
+            values.append(node.value)
+            if len(flags) == block_size:
+                _write_block(fp, flags, values)
+                flags, values = [], []
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+        if flags:
+            _write_block(fp, flags, values)
+        fp.write(b'\x00')
+
+    def deserialize_binary(self, fp):
+        """
+        Deserialize Binary Tree written by serialize_binary
+        Reads one block at a time from the file object
+        Time Complexity: O(n)
+        Space Complexity: O(h + block_size)
+        """
+        if fp.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError('not a binary tree stream')
+        root = None
+        need_left = None  # previous node, if its left child comes next
+        pending = []      # nodes still waiting for their right child
+        for value, has_left, has_right in _read_blocks(fp):
+            node = TreeNode(value)
+            if root is None:
+                root = node
+            elif need_left:
+                need_left.left = node
+            else:
+                pending.pop().right = node
+            if has_right:
+                pending.append(node)
+            need_left = node if has_left else None
+        return root
+
+
+def _write_varint(out, n):
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(buf, pos):
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _read_stream_varint(fp):
+    result = shift = 0
+    while True:
+        byte = fp.read(1)
+        if not byte:
+            raise ValueError('truncated binary tree stream')
+        result |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return result
+        shift += 7
+
+
+def _write_block(fp, flags, values):
+    bitmap = bytearray((2 * len(flags) + 7) // 8)
+    for i, (has_left, has_right) in enumerate(flags):
+        if has_left:
+            bitmap[(2 * i) >> 3] |= 1 << ((2 * i) & 7)
+        if has_right:
+            bitmap[(2 * i + 1) >> 3] |= 1 << ((2 * i + 1) & 7)
+    payload = bitmap
+    for v in values:
+        # Zigzag: 0, -1, 1, -2, ... -> 0, 1, 2, 3, ... so small negatives stay short
+        _write_varint(payload, v * 2 if v >= 0 else -v * 2 - 1)
+    header = bytearray()
+    _write_varint(header, len(flags))
+    _write_varint(header, len(payload))
+    fp.write(header)
+    fp.write(payload)
+
+
+def _read_blocks(fp):
+    """Yield (value, has_left, has_right) for every node in the stream."""
+    while True:
+        count = _read_stream_varint(fp)
+        if count == 0:
+            return
+        size = _read_stream_varint(fp)
+        payload = fp.read(size)
+        if len(payload) != size:
+            raise ValueError('truncated binary tree stream')
+        pos = (2 * count + 7) // 8
+        for i in range(count):
+            z, pos = _read_varint(payload, pos)
+            yield ((z >> 1) if not z & 1 else -((z + 1) >> 1),
+                   bool(payload[(2 * i) >> 3] >> ((2 * i) & 7) & 1),
+                   bool(payload[(2 * i + 1) >> 3] >> ((2 * i + 1) & 7) & 1))
 
 # Example of an unbalanced tree
 def create_unbalanced_tree():
@@ -762,6 +1112,7 @@ if __name__ == "__main__":
 
     unbalanced_root = create_unbalanced_tree()
     print('zigzag level order',unbalanced_root.zigzag_level_order(unbalanced_root))
+    print('views', unbalanced_root.tree_views(unbalanced_root, ('right', 'left', 'depth')))
     print("Unbalanced Tree Properties:")
     print("Height:", unbalanced_root.maxDepth(unbalanced_root))
     print("Is Balanced:", unbalanced_root.isBalanced(unbalanced_root))
@@ -772,4 +1123,7 @@ if __name__ == "__main__":
     print("\nBalanced Tree Properties:")
     print("Height:", balanced_root.maxDepth(balanced_root))
     print("Is Balanced:", balanced_root.isBalanced(balanced_root))
-    print('LCA of 4 and 5:', balanced_root.lowestCommonAncestor(balanced_root, balanced_root.left.left, balanced_root.left.right).value)
\ No newline at end of file
+    print('LCA of 4 and 5:', balanced_root.lowestCommonAncestor(balanced_root, balanced_root.left.left, balanced_root.left.right).value)
+    print('Streamed BSTs balanced for n < 500:', all(
+        balanced_root.isBalanced(balanced_root.sortedIterToBST(iter(range(n))))
+        for n in range(500)))
\ No newline at end of file
@@ -0,0 +1,227 @@
+"""
+TREE BENCHMARK SUITE
+====================
+
+Times every TreeNode operation on deterministic, scalable trees and writes
+one JSON record per (shape, size, operation) so runs can be diffed between
+versions.
+
+Shapes (all built with a fixed seed):
+    complete -> complete binary tree, values in level order
+    random   -> every new node fills a uniformly random free child slot
+    skewed   -> a left-leaning chain (depth n)
+    bst      -> balanced BST over 0..n-1
+
+Timing and output come from benchmark_harness.py at the repository root,
+shared with Heap/benchmark.py: the best of --repeat wall-time runs, one
+more run under tracemalloc for the peak memory, one JSON line per case.
+Inputs such as traversal lists or serialized strings are prepared outside
+the timed region. Operations that fail (for example RecursionError in the
+recursive constructors on skewed trees) are recorded with an "error" field
+instead of a time.
+
+Usage:
+    python benchmark.py --sizes 1e3 1e4 1e5 --shapes complete skewed \\
+        --output results.jsonl --label my-branch
+"""
+import argparse
+import io
+import os
+import random
+import sys
+
+if __name__ == "__main__":
+    # Run as a script from its folder: make the shared harness at the
+    # repository root importable (importers put the root on sys.path)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmark_harness import add_common_arguments, common_fields, open_output, run_case
+from Tree import TreeNode
+from lca_index import LCAIndex
+
+SHAPES = ('complete', 'random', 'skewed', 'bst')
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5)
+SEED = 12345
+
+
+# TREE GENERATORS
+def complete_tree(n, seed=SEED):
+    return TreeNode(0).buildTree_from_levelorder(list(range(n)))
+
+
+def random_tree(n, seed=SEED):
+    if n == 0:
+        return None
+    rng = random.Random(seed)
+    root = TreeNode(0)
+    slots = [(root, True), (root, False)]
+    for value in range(1, n):
+        k = rng.randrange(len(slots))
+        parent, is_left = slots[k]
+        # O(1) removal: move the last free slot into the used one
+        slots[k] = slots[-1]
+        slots.pop()
+        node = TreeNode(value)
+        if is_left:
+            parent.left = node
+        else:
+            parent.right = node
+        slots.append((node, True))
+        slots.append((node, False))
+    return root
+
+
+def skewed_tree(n, seed=SEED):
+    root = None
+    for value in range(n - 1, -1, -1):
+        node = TreeNode(value)
+        node.left = root
+        root = node
+    return root
+
+
+def bst_tree(n, seed=SEED):
+    return TreeNode(0).sortedIterToBST(range(n))
+
+
+GENERATORS = {
+    'complete': complete_tree,
+    'random': random_tree,
+    'skewed': skewed_tree,
+    'bst': bst_tree,
+}
+
+
+# OPERATIONS
+# Each entry: name -> (prepare(helper, root) -> args, run(helper, *args), bst_only)
+def _digits_copy(helper, root):
+    # sumNumbers builds one digit per level, so on deep trees (skewed: depth n)
+    # the path numbers would be n-digit ints and the run quadratic. Inner
+    # nodes get 0 and leaves value % 10: the same walk, bounded numbers.
+    copy = TreeNode(None)
+    stack = [(root, copy)]
+    while stack:
+        node, out = stack.pop()
+        leaf = not node.left and not node.right
+        out.value = node.value % 10 if leaf else 0
+        if node.left:
+            out.left = TreeNode(None)
+            stack.append((node.left, out.left))
+        if node.right:
+            out.right = TreeNode(None)
+            stack.append((node.right, out.right))
+    return copy
+
+
+def _extreme_nodes(helper, root):
+    left = right = root
+    while left.left or left.right:
+        left = left.left or left.right
+    while right.right or right.left:
+        right = right.right or right.left
+    return left, right
+
+
+def _binary_bytes(helper, root):
+    fp = io.BytesIO()
+    helper.serialize_binary(root, fp)
+    return fp.getvalue()
+
+
+def _levelorder_with_gaps(helper, root):
+    """buildTree_from_levelorder input: root, then both child slots of every node in BFS order (-1 = none)."""
+    out = [root.value]
+    for level in helper.iter_levels(root):
+        for node in level:
+            out.append(node.left.value if node.left else -1)
+            out.append(node.right.value if node.right else -1)
+    while out and out[-1] == -1:
+        out.pop()
+    return out
+
+
+OPERATIONS = {
+    # traversals
+    'inorder_traversal': (lambda h, r: (r,), lambda h, r: h.inorder_traversal(r), False),
+    'preorder_traversal': (lambda h, r: (r,), lambda h, r: h.preorder_traversal(r), False),
+    'postorder_traversal': (lambda h, r: (r,), lambda h, r: h.postorder_traversal(r), False),
+    'morris_inorder': (lambda h, r: (r,), lambda h, r: list(h.morris_inorder(r)), False),
+    'levelorder_traversal': (lambda h, r: (r,), lambda h, r: h.levelorder_traversal(r), False),
+    'levelorder_traversal_with_levels': (lambda h, r: (r,), lambda h, r: h.levelorder_traversal_with_levels(r), False),
+    # views
+    'right_side_view': (lambda h, r: (r,), lambda h, r: h.right_side_view(r), False),
+    'left_side_view': (lambda h, r: (r,), lambda h, r: h.left_side_view(r), False),
+    'zigzag_level_order': (lambda h, r: (r,), lambda h, r: h.zigzag_level_order(r), False),
+    'tree_views': (lambda h, r: (r,), lambda h, r: h.tree_views(r), False),
+    'vertical_order_traversal': (lambda h, r: (r,), lambda h, r: h.vertical_order_traversal(r), False),
+    'vertical_order_traversal_with_levels': (lambda h, r: (r,), lambda h, r: h.vertical_order_traversal_with_levels(r), False),
+    # properties
+    'maxDepth': (lambda h, r: (r,), lambda h, r: h.maxDepth(r), False),
+    'isBalanced': (lambda h, r: (r,), lambda h, r: h.isBalanced(r), False),
+    'isValidBST': (lambda h, r: (r,), lambda h, r: h.isValidBST(r), False),
+    'hasPathSum': (lambda h, r: (r,), lambda h, r: h.hasPathSum(r, -1), False),
+    'sumNumbers': (lambda h, r: (_digits_copy(h, r),), lambda h, r: h.sumNumbers(r), False),
+    # constructors (values are unique in every generated shape)
+    'buildTree_from_inorder_preorder': (
+        lambda h, r: (h.inorder_traversal(r), h.preorder_traversal(r)),
+        lambda h, i, p: h.buildTree_from_inorder_preorder(i, p), False),
+    'buildTree_from_inorder_postorder': (
+        lambda h, r: (h.inorder_traversal(r), h.postorder_traversal(r)),
+        lambda h, i, p: h.buildTree_from_inorder_postorder(i, p), False),
+    'buildTree_from_levelorder_inorder': (
+        lambda h, r: (h.levelorder_traversal(r), h.inorder_traversal(r)),
+        lambda h, lo, i: h.buildTree_from_levelorder_inorder(lo, i), False),
+    'buildTree_from_levelorder': (
+        lambda h, r: (_levelorder_with_gaps(h, r),),
+        lambda h, lo: h.buildTree_from_levelorder(lo), False),
+    'sortedArrayToBST': (lambda h, r: (h.inorder_traversal(r),), lambda h, a: h.sortedArrayToBST(a), True),
+    'sortedIterToBST': (lambda h, r: (h.inorder_traversal(r),), lambda h, a: h.sortedIterToBST(iter(a)), True),
+    # serialization
+    'serialize': (lambda h, r: (r,), lambda h, r: h.serialize(r), False),
+    'deserialize': (lambda h, r: (h.serialize(r),), lambda h, s: h.deserialize(s), False),
+    'serialize_binary': (lambda h, r: (r,), lambda h, r: h.serialize_binary(r, io.BytesIO()), False),
+    'deserialize_binary': (lambda h, r: (_binary_bytes(h, r),),
+                           lambda h, b: h.deserialize_binary(io.BytesIO(b)), False),
+    # lowest common ancestor
+    'lowestCommonAncestor': (lambda h, r: (r,) + _extreme_nodes(h, r),
+                             lambda h, r, p, q: h.lowestCommonAncestor(r, p, q), False),
+    'lowestCommonAncestor_in_BST': (lambda h, r: (r,) + _extreme_nodes(h, r),
+                                    lambda h, r, p, q: h.lowestCommonAncestor_in_BST(r, p, q), True),
+    'LCAIndex_build': (lambda h, r: (r,), lambda h, r: LCAIndex(r), False),
+    'LCAIndex_query': (lambda h, r: (LCAIndex(r),) + _extreme_nodes(h, r),
+                       lambda h, index, p, q: index.lca(p, q), False),
+}
+
+
+def run_suite(sizes=DEFAULT_SIZES, shapes=SHAPES, operations=None, repeat=3,
+              memory=True, label=None, out=sys.stdout):
+    """Run the benchmarks and write one JSON object per line to out."""
+    helper = TreeNode(0)
+    names = operations or list(OPERATIONS)
+    common = common_fields(label)
+    for shape in shapes:
+        for size in sizes:
+            root = GENERATORS[shape](size)
+            for name in names:
+                prepare, run, bst_only = OPERATIONS[name]
+                if bst_only and shape != 'bst':
+                    continue
+                record = dict(common, shape=shape, size=size, op=name)
+                run_case(out, record, run,
+                         lambda: (helper,) + tuple(prepare(helper, root)),
+                         repeat, memory)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    add_common_arguments(parser, DEFAULT_SIZES, 'tree sizes, e.g. 1e3 1e6')
+    parser.add_argument('--shapes', nargs='+', default=SHAPES, choices=SHAPES)
+    parser.add_argument('--ops', nargs='+', choices=sorted(OPERATIONS), help='subset of operations')
+    args = parser.parse_args(argv)
+
+    with open_output(args.output) as out:
+        run_suite(args.sizes, args.shapes, args.ops, args.repeat,
+                  not args.no_memory, args.label, out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+CACHED SUBTREE AGGREGATES
+=========================
+
+Opt-in node type for trees that are queried repeatedly between small local
+edits. Every CachedTreeNode keeps a parent pointer and caches for its subtree
+
+    height, size, total (sum of values), balanced,
+    path_weight / path_numbers (for sumNumbers),
+    min_path / max_path (smallest / largest root-to-leaf sum)
+
+Setting .value, .left or .right marks the node and its ancestors dirty,
+stopping at the first ancestor that is already dirty (everything above a
+dirty node is dirty too). A query only recomputes dirty nodes, so after a
+local edit it costs O(h) instead of O(n).
+
+maxDepth, isBalanced, sumNumbers and hasPathSum keep the TreeNode
+signatures and fall back to the plain versions for ordinary TreeNode roots.
+hasPathSum uses the cached min/max path sums to skip subtrees that cannot
+reach the target; that prunes most of the tree in practice but is still
+O(n) in the worst case.
+"""
+from Tree import TreeNode
+
+
+class CachedTreeNode(TreeNode):
+    __slots__ = ('_value', '_left', '_right', 'parent', 'dirty',
+                 'height', 'size', 'total', 'balanced',
+                 'path_weight', 'path_numbers', 'min_path', 'max_path')
+
+    def __init__(self, value):
+        self.parent = None
+        self._left = None
+        self._right = None
+        self.dirty = True
+        super().__init__(value)
+
+    @classmethod
+    def from_tree(cls, root):
+        """
+        Copy a TreeNode tree into cached nodes
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        if not root:
+            return None
+        new_root = cls(root.value)
+        stack = [(root, new_root)]
+        while stack:
+            old, new = stack.pop()
+            if old.left:
+                new.left = cls(old.left.value)
+                stack.append((old.left, new.left))
+            if old.right:
+                new.right = cls(old.right.value)
+                stack.append((old.right, new.right))
+        return new_root
+
+    # EDITS INVALIDATE THE ANCESTOR PATH
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self.invalidate()
+
+    @property
+    def left(self):
+        return self._left
+
+    @left.setter
+    def left(self, child):
+        self._left = self._adopt(self._left, child)
+
+    @property
+    def right(self):
+        return self._right
+
+    @right.setter
+    def right(self, child):
+        self._right = self._adopt(self._right, child)
+
+    def _adopt(self, old, child):
+        # Only drop the back pointer if it is ours: a child that was moved
+        # elsewhere already points at its new parent
+        if old is not None and old is not child and old.parent is self:
+            old.parent = None
+        if child is not None:
+            child.parent = self
+        self.invalidate()
+        return child
+
+    def invalidate(self):
+        """
+        Mark this node and its ancestors dirty
+        Time Complexity: O(h)
+        """
+        node = self
+        while node is not None and not node.dirty:
+            node.dirty = True
+            node = node.parent
+
+    def refresh(self):
+        """
+        Recompute the aggregates of every dirty node in this subtree
+        Time Complexity: O(number of dirty nodes)
+        """
+        if not self.dirty:
+            return self
+        stack = [self]
+        while stack:
+            node = stack[-1]
+            pending = [child for child in (node._left, node._right)
+                       if child is not None and child.dirty]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            node._recompute()
+        return self
+
+    def _recompute(self):
+        value = self._value
+        children = [child for child in (self._left, self._right) if child is not None]
+        left_height = self._left.height if self._left else 0
+        right_height = self._right.height if self._right else 0
+        self.height = 1 + max(left_height, right_height)
+        self.size = 1 + sum(child.size for child in children)
+        self.total = value + sum(child.total for child in children)
+        self.balanced = (abs(left_height - right_height) <= 1 and
+                         all(child.balanced for child in children))
+        if children:
+            # Each leaf number below a child gains this digit in front
+            weight = sum(child.path_weight for child in children)
+            self.path_weight = 10 * weight
+            self.path_numbers = value * weight + sum(child.path_numbers for child in children)
+            self.min_path = value + min(child.min_path for child in children)
+            self.max_path = value + max(child.max_path for child in children)
+        else:
+            self.path_weight = 10
+            self.path_numbers = value
+            self.min_path = self.max_path = value
+        self.dirty = False
+
+    # TRAVERSALS
+    def morris_inorder(self, root):
+        """
+        Inorder values without Morris threading
+        Threading rewires right pointers, which would reparent nodes and
+        invalidate caches along the way, so the stack walk is used instead.
+        Time Complexity: O(n)
+        Space Complexity: O(h)
+        """
+        if not isinstance(root, CachedTreeNode):
+            return super().morris_inorder(root)
+        return self.iter_inorder(root)
+
+    def morris_preorder(self, root):
+        """
+        Preorder values without Morris threading (see morris_inorder)
+        Time Complexity: O(n)
+        Space Complexity: O(h)
+        """
+        if not isinstance(root, CachedTreeNode):
+            return super().morris_preorder(root)
+        return self.iter_preorder(root)
+
+    # CACHED QUERIES (same signatures as TreeNode)
+    def maxDepth(self, root):
+        """
+        Maximum Depth of Binary Tree
+        Time Complexity: O(h) after a local edit, O(1) when nothing changed
+        """
+        if not isinstance(root, CachedTreeNode):
+            return super().maxDepth(root)
+        return root.refresh().height
+
+    def isBalanced(self, root):
+        """
+        Check if Tree is Balanced
+        Time Complexity: O(h) after a local edit, O(1) when nothing changed
+        """
+        if not isinstance(root, CachedTreeNode):
+            return super().isBalanced(root)
+        return root.refresh().balanced
+
+    def sumNumbers(self, root):
+        """
+        Sum Root to Leaf Numbers
+        Time Complexity: O(h) after a local edit, O(1) when nothing changed
+        """
+        if not isinstance(root, CachedTreeNode):
+            return super().sumNumbers(root)
+        return root.refresh().path_numbers
+
+    def hasPathSum(self, root, targetSum):
+        """
+        Path Sum Check, skipping subtrees whose cached min/max path sums
+        cannot reach the target
+        Time Complexity: O(h) to refresh, then O(n) worst case for the search
+        """
+        if not isinstance(root, CachedTreeNode):
+            return super().hasPathSum(root, targetSum)
+        root.refresh()
+        stack = [(root, targetSum)]
+        while stack:
+            node, remaining = stack.pop()
+            if not node.min_path <= remaining <= node.max_path:
+                continue
+            if node.min_path == node.max_path == remaining:
+                # Every root-to-leaf path below has exactly this sum
+                return True
+            remaining -= node._value
+            if node._right:
+                stack.append((node._right, remaining))
+            if node._left:
+                stack.append((node._left, remaining))
+        return False
+
+    def subtree_size(self, root):
+        """Number of nodes under root, O(h) after a local edit."""
+        return root.refresh().size if root else 0
+
+    def subtree_sum(self, root):
+        """Sum of values under root, O(h) after a local edit."""
+        return root.refresh().total if root else 0
+
+
+if __name__ == "__main__":
+    from Tree import create_unbalanced_tree
+
+    root = CachedTreeNode.from_tree(create_unbalanced_tree())
+    print("height:", root.maxDepth(root), "balanced:", root.isBalanced(root))
+    print("sumNumbers:", root.sumNumbers(root), "size:", root.subtree_size(root))
+    print("hasPathSum 16:", root.hasPathSum(root, 16))
+
+    # Local edit: only the path 3 -> 7 -> 9 is recomputed on the next query
+    root.right.right.right.value = 4
+    root.left.right.left = None
+    print("after edits -> sumNumbers:", root.sumNumbers(root), "height:", root.maxDepth(root))
+    print("hasPathSum 15:", root.hasPathSum(root, 15))
@@ -0,0 +1,377 @@
+"""
+COMPACT (ARRAY-BACKED) BINARY TREE
+==================================
+
+Struct-of-arrays layout: instead of one TreeNode object per node, the tree
+keeps three parallel typed arrays
+
+    values[i]  -> value stored at node i
+    left[i]    -> index of the left child of node i  (-1 = no child)
+    right[i]   -> index of the right child of node i (-1 = no child)
+
+A node costs 4 + 4 + 8 = 16 bytes instead of a full Python object, and a
+traversal walks flat arrays instead of chasing object pointers.
+Nodes are laid out in preorder, so a left child usually sits right next to
+its parent.
+
+All operations are iterative, so skewed trees never hit the recursion limit.
+"""
+from array import array
+from collections import deque
+
+from Tree import TreeNode
+
+NIL = -1
+
+
+def _bst_slots(n):
+    """
+    Preorder slots of the sortedArrayToBST shape over n nodes, in inorder
+    Yields (slot, left child slot, right child slot) for the 1st, 2nd, ...
+    smallest value, with NIL for a missing child.
+    Time Complexity: O(n)
+    Space Complexity: O(log n)
+    """
+    # stack of (mid, hi, slot, lo) for ranges whose left part is pending
+    stack = []
+    lo, hi, p = 0, n - 1, 0
+    while stack or lo <= hi:
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            stack.append((mid, hi, p, lo))
+            hi, p = mid - 1, p + 1
+        mid, hi, p, lo = stack.pop()
+        yield (p, p + 1 if lo < mid else NIL,
+               p + 1 + mid - lo if mid < hi else NIL)
+        lo, p = mid + 1, p + 1 + mid - lo
+
+
+class CompactTree:
+    def __init__(self, typecode='q'):
+        """
+        typecode: array typecode used for node values ('q' = 64-bit int,
+        'd' = float). Pass None to keep values in a plain list (any object).
+        """
+        self.typecode = typecode
+        self.values = array(typecode) if typecode else []
+        self.left = array('i')
+        self.right = array('i')
+        self.root = NIL
+
+    def __len__(self):
+        return len(self.left)
+
+    def add_node(self, value):
+        """Append a detached node and return its index."""
+        self.values.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        return len(self.left) - 1
+
+    # CONVERSIONS
+    @classmethod
+    def from_treenode(cls, root, typecode='q'):
+        """
+        Build a CompactTree from a TreeNode tree (preorder layout)
+        Time Complexity: O(n)
+        Space Complexity: O(h) extra
+        """
+        tree = cls(typecode)
+        if not root:
+            return tree
+        values, left, right = tree.values, tree.left, tree.right
+        # stack of (node, parent index, is_left_child)
+        stack = [(root, NIL, False)]
+        while stack:
+            node, parent, is_left = stack.pop()
+            idx = len(left)
+            values.append(node.value)
+            left.append(NIL)
+            right.append(NIL)
+            if parent == NIL:
+                tree.root = idx
+            elif is_left:
+                left[parent] = idx
+            else:
+                right[parent] = idx
+            if node.right:
+                stack.append((node.right, idx, False))
+            if node.left:
+                stack.append((node.left, idx, True))
+        return tree
+
+    @classmethod
+    def from_sorted(cls, iterable, typecode='q', length=None):
+        """
+        Streaming bulk load of a balanced BST (same shape as sortedArrayToBST)
+        Nodes are in preorder like every CompactTree: the range [lo, hi]
+        rooted at slot p keeps its left range at p + 1 and its right range
+        at p + 1 + (mid - lo). An inorder walk over these ranges visits the
+        slots in sorted order.
+
+        Known length (len() or length=): values go straight into their slots.
+        Unknown length: values are appended as they arrive, then moved to
+            their preorder slots in place by following permutation cycles
+            (the target slots are parked in the left array meanwhile).
+        The input is never copied into a second buffer.
+        Time Complexity: O(n)
+        Space Complexity: O(log n) besides the arrays
+        """
+        tree = cls(typecode)
+        if length is None and hasattr(iterable, '__len__'):
+            length = len(iterable)
+        items = iter(iterable)
+
+        if length is None:
+            values = tree.values
+            values.extend(items)
+            n = len(values)
+            left = tree.left = array('i', [NIL]) * n
+            right = tree.right = array('i', [NIL]) * n
+            for i, (p, _, _) in enumerate(_bst_slots(n)):
+                left[i] = p
+            for start in range(n):
+                if left[start] == NIL:
+                    continue
+                carry, i = values[start], start
+                while True:
+                    target = left[i]
+                    left[i] = NIL
+                    carry, values[target] = values[target], carry
+                    i = target
+                    if i == start:
+                        break
+            for p, left_slot, right_slot in _bst_slots(n):
+                left[p], right[p] = left_slot, right_slot
+        else:
+            n = length
+            values = tree.values = array(typecode, [0]) * n if typecode else [None] * n
+            left = tree.left = array('i', [NIL]) * n
+            right = tree.right = array('i', [NIL]) * n
+            for p, left_slot, right_slot in _bst_slots(n):
+                try:
+                    values[p] = next(items)
+                except StopIteration:
+                    raise ValueError(f'iterable has fewer than {n} items') from None
+                left[p], right[p] = left_slot, right_slot
+        if n:
+            tree.root = 0
+        return tree
+
+    def to_treenode(self):
+        """
+        Rebuild a TreeNode tree from the arrays
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        if self.root == NIL:
+            return None
+        values, left, right = self.values, self.left, self.right
+        nodes = [TreeNode(v) for v in values]
+        for i, node in enumerate(nodes):
+            if left[i] != NIL:
+                node.left = nodes[left[i]]
+            if right[i] != NIL:
+                node.right = nodes[right[i]]
+        return nodes[self.root]
+
+    def is_preorder(self):
+        """
+        True if node i is the i-th node of a preorder walk from the root,
+        i.e. every subtree is one contiguous slice of the arrays
+        (always the case for from_treenode / from_sorted, not for add_node)
+        Time Complexity: O(n)
+        Space Complexity: O(h)
+        """
+        left, right = self.left, self.right
+        expected = 0
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            i = stack.pop()
+            if i != expected:
+                return False
+            expected += 1
+            if right[i] != NIL:
+                stack.append(right[i])
+            if left[i] != NIL:
+                stack.append(left[i])
+        return expected == len(left)
+
+    # 1. DFS TRAVERSALS
+    def inorder_traversal(self):
+        """
+        Inorder Traversal (Left → Root → Right)
+        Time Complexity: O(n)
+        Space Complexity: O(h)
+        """
+        values, left, right = self.values, self.left, self.right
+        result, stack = [], []
+        i = self.root
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            result.append(values[i])
+            i = right[i]
+        return result
+
+    def preorder_traversal(self):
+        """
+        Preorder Traversal (Root → Left → Right)
+        Time Complexity: O(n)
+        Space Complexity: O(h)
+        """
+        values, left, right = self.values, self.left, self.right
+        result = []
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            i = stack.pop()
+            result.append(values[i])
+            if right[i] != NIL:
+                stack.append(right[i])
+            if left[i] != NIL:
+                stack.append(left[i])
+        return result
+
+    def postorder_traversal(self):
+        """
+        Postorder Traversal (Left → Right → Root)
+        Reverse of a Root → Right → Left walk
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        values, left, right = self.values, self.left, self.right
+        result = []
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            i = stack.pop()
+            result.append(values[i])
+            if left[i] != NIL:
+                stack.append(left[i])
+            if right[i] != NIL:
+                stack.append(right[i])
+        result.reverse()
+        return result
+
+    # 2. BFS TRAVERSAL
+    def levelorder_traversal(self):
+        """
+        Level Order Traversal (BFS)
+        Time Complexity: O(n)
+        Space Complexity: O(w) where w is max width
+        """
+        values, left, right = self.values, self.left, self.right
+        result = []
+        queue = deque([self.root] if self.root != NIL else [])
+        while queue:
+            i = queue.popleft()
+            result.append(values[i])
+            if left[i] != NIL:
+                queue.append(left[i])
+            if right[i] != NIL:
+                queue.append(right[i])
+        return result
+
+    # 3. TREE PROPERTIES
+    def maxDepth(self):
+        """
+        Maximum Depth of Binary Tree
+        Time Complexity: O(n)
+        Space Complexity: O(h)
+        """
+        left, right = self.left, self.right
+        best = 0
+        stack = [(self.root, 1)] if self.root != NIL else []
+        while stack:
+            i, depth = stack.pop()
+            if depth > best:
+                best = depth
+            if left[i] != NIL:
+                stack.append((left[i], depth + 1))
+            if right[i] != NIL:
+                stack.append((right[i], depth + 1))
+        return best
+
+    def isBalanced(self):
+        """
+        Check if Tree is Balanced
+        Heights are filled bottom-up in reverse preorder, so every child is
+        done before its parent without recursion.
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        left, right = self.left, self.right
+        order = []
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            i = stack.pop()
+            order.append(i)
+            if left[i] != NIL:
+                stack.append(left[i])
+            if right[i] != NIL:
+                stack.append(right[i])
+        height = array('i', bytes(4 * len(left)))
+        for i in reversed(order):
+            lh = height[left[i]] if left[i] != NIL else 0
+            rh = height[right[i]] if right[i] != NIL else 0
+            if abs(lh - rh) > 1:
+                return False
+            height[i] = 1 + max(lh, rh)
+        return True
+
+    def isValidBST(self):
+        """
+        Validate Binary Search Tree
+        Inorder walk must be strictly increasing
+        Time Complexity: O(n)
+        Space Complexity: O(h)
+        """
+        values, left, right = self.values, self.left, self.right
+        stack = []
+        prev = None
+        i = self.root
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            if prev is not None and values[i] <= prev:
+                return False
+            prev = values[i]
+            i = right[i]
+        return True
+
+    # 4. SERIALIZATION
+    def serialize(self):
+        """
+        Serialize in the same text format as TreeNode.serialize
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        values, left, right = self.values, self.left, self.right
+        tokens = []
+        stack = [self.root]
+        while stack:
+            i = stack.pop()
+            if i == NIL:
+                tokens.append('null')
+                continue
+            tokens.append(f'#{values[i]}')
+            stack.append(right[i])
+            stack.append(left[i])
+        return ' '.join(tokens)
+
+
+if __name__ == "__main__":
+    from Tree import create_balanced_tree, create_unbalanced_tree
+
+    for build in (create_balanced_tree, create_unbalanced_tree):
+        root = build()
+        tree = CompactTree.from_treenode(root)
+        print(build.__name__)
+        print("  inorder:", tree.inorder_traversal())
+        print("  levelorder:", tree.levelorder_traversal())
+        print("  height:", tree.maxDepth(), "balanced:", tree.isBalanced())
+        print("  serialize matches:", tree.serialize() == root.serialize(root))
+        print("  round trip:", root.serialize(tree.to_treenode()) == root.serialize(root))
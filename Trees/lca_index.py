@@ -0,0 +1,165 @@
+"""
+LCA INDEX (BINARY LIFTING)
+==========================
+
+TreeNode.lowestCommonAncestor walks the whole tree for every query. For a
+tree that rarely changes, LCAIndex pays one O(n log h) pass up front:
+
+    up[0][i] = parent of node i          (the root is its own parent)
+    up[j][i] = up[j-1][up[j-1][i]]       (the 2^j-th ancestor)
+
+and afterwards answers each query in O(log h), h = height of the tree.
+Tables are typed arrays with log2(h) + 1 rows, so a balanced tree needs
+only a handful of rows even with millions of nodes.
+
+The same index answers depth, distance and k-th ancestor queries.
+"""
+from array import array
+
+
+class LCAIndex:
+    def __init__(self, root):
+        """
+        Preprocess a TreeNode tree
+        Time Complexity: O(n log h)
+        Space Complexity: O(n log h)
+        """
+        self._nodes = []
+        self._index = {}
+        parent = array('i')
+        depth = array('i')
+        # Iterative preorder: a parent is always numbered before its children
+        stack = [(root, 0, 0)] if root else []
+        while stack:
+            node, parent_idx, node_depth = stack.pop()
+            idx = len(self._nodes)
+            self._nodes.append(node)
+            self._index[node] = idx
+            parent.append(parent_idx if idx else 0)
+            depth.append(node_depth)
+            if node.right:
+                stack.append((node.right, idx, node_depth + 1))
+            if node.left:
+                stack.append((node.left, idx, node_depth + 1))
+        self._depth = depth
+
+        height = max(depth) if depth else 0
+        self._up = [parent]
+        for _ in range(1, max(1, height.bit_length())):
+            prev = self._up[-1]
+            self._up.append(array('i', [prev[a] for a in prev]))
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def _idx(self, node):
+        try:
+            return self._index[node]
+        except KeyError:
+            raise KeyError(f'{node!r} is not in the indexed tree') from None
+
+    def _lift(self, i, k):
+        j = 0
+        while k:
+            if k & 1:
+                i = self._up[j][i]
+            k >>= 1
+            j += 1
+        return i
+
+    def _lca(self, a, b):
+        depth = self._depth
+        if depth[a] < depth[b]:
+            a, b = b, a
+        a = self._lift(a, depth[a] - depth[b])
+        if a == b:
+            return a
+        for up in reversed(self._up):
+            if up[a] != up[b]:
+                a, b = up[a], up[b]
+        return self._up[0][a]
+
+    def depth(self, node):
+        """Depth of node (root = 0)."""
+        return self._depth[self._idx(node)]
+
+    def lca(self, p, q):
+        """
+        Lowest Common Ancestor of p and q
+        Time Complexity: O(log h)
+        """
+        return self._nodes[self._lca(self._idx(p), self._idx(q))]
+
+    def distance(self, p, q):
+        """
+        Number of edges on the path between p and q
+        Time Complexity: O(log h)
+        """
+        a, b = self._idx(p), self._idx(q)
+        depth = self._depth
+        return depth[a] + depth[b] - 2 * depth[self._lca(a, b)]
+
+    def kth_ancestor(self, node, k):
+        """
+        k-th ancestor of node (k = 0 is the node itself), None if too far up
+        Time Complexity: O(log h)
+        """
+        i = self._idx(node)
+        if k < 0 or k > self._depth[i]:
+            return None
+        return self._nodes[self._lift(i, k)]
+
+    def lca_batch(self, ps, qs):
+        """
+        LCA for many pairs at once: returns [lca(ps[0], qs[0]), ...]
+        Lifts all pairs one table row at a time, so the per-query work runs
+        in list comprehensions instead of per-call Python overhead.
+        Time Complexity: O(m log h) for m pairs
+        """
+        if len(ps) != len(qs):
+            raise ValueError('ps and qs must have the same length')
+        depth = self._depth
+        a = [self._idx(p) for p in ps]
+        b = [self._idx(q) for q in qs]
+        # Make a the deeper node of each pair
+        for i in range(len(a)):
+            if depth[a[i]] < depth[b[i]]:
+                a[i], b[i] = b[i], a[i]
+        diff = [depth[x] - depth[y] for x, y in zip(a, b)]
+        for j, up in enumerate(self._up):
+            bit = 1 << j
+            a = [up[x] if d & bit else x for x, d in zip(a, diff)]
+        done = [x == y for x, y in zip(a, b)]
+        for up in reversed(self._up):
+            moved = [(up[x], up[y]) if up[x] != up[y] else (x, y) for x, y in zip(a, b)]
+            a = [x for x, _ in moved]
+            b = [y for _, y in moved]
+        parent = self._up[0]
+        nodes = self._nodes
+        return [nodes[x] if same else nodes[parent[x]] for x, same in zip(a, done)]
+
+    def distance_batch(self, ps, qs):
+        """Distances for many pairs at once, see lca_batch."""
+        depth = self._depth
+        index = self._index
+        return [depth[index[p]] + depth[index[q]] - 2 * depth[index[c]]
+                for p, q, c in zip(ps, qs, self.lca_batch(ps, qs))]
+
+
+if __name__ == "__main__":
+    from Tree import create_balanced_tree, create_unbalanced_tree
+
+    root = create_unbalanced_tree()
+    index = LCAIndex(root)
+    n8, n9, n5 = root.left.right.left, root.right.right.right, root.left.right
+    print("LCA of 8 and 9:", index.lca(n8, n9).value)
+    print("LCA of 8 and 5:", index.lca(n8, n5).value)
+    print("distance 8 -> 9:", index.distance(n8, n9))
+    print("2nd ancestor of 8:", index.kth_ancestor(n8, 2).value)
+
+    root = create_balanced_tree()
+    index = LCAIndex(root)
+    ps = [root.left.left, root.left.left, root.right.left]
+    qs = [root.left.right, root.right.right, root.right]
+    print("batch LCA:", [node.value for node in index.lca_batch(ps, qs)])
+    print("batch distance:", index.distance_batch(ps, qs))
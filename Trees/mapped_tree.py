@@ -0,0 +1,157 @@
+"""
+MEMORY-MAPPED PERSISTED TREES
+=============================
+
+On-disk layout (little endian):
+
+    header : magic b'TRM1' | node count (uint64) | root index (int64)
+    records: one 16-byte record per node -> value (int64) | left (int32) | right (int32)
+
+Child indices point at other records, -1 means no child; it is the
+CompactTree layout written straight to disk.
+
+MappedTree opens the file through mmap, so opening is instant whatever the
+file size. Nodes are materialized only when they are touched, and the
+read-only nodes expose .value/.left/.right, so the read-only TreeNode
+methods (hasPathSum, lowestCommonAncestor_in_BST, iter_inorder, ...) work on
+them unchanged. Memory use is proportional to the nodes actually visited.
+"""
+import mmap
+import os
+import struct
+
+from compact_tree import NIL, CompactTree
+
+MAGIC = b'TRM1'
+HEADER = struct.Struct('<4sQq')
+RECORD = struct.Struct('<qii')
+# Records packed per write call when saving
+WRITE_BATCH = 1 << 16
+
+
+def save_mapped_tree(tree, path):
+    """
+    Write a TreeNode tree (or a CompactTree) in the mapped layout
+    Time Complexity: O(n)
+    Space Complexity: O(n) for the compact copy of a TreeNode tree
+    """
+    if not isinstance(tree, CompactTree):
+        tree = CompactTree.from_treenode(tree)
+    values, left, right = tree.values, tree.left, tree.right
+    with open(path, 'wb') as fp:
+        fp.write(HEADER.pack(MAGIC, len(tree), tree.root))
+        for start in range(0, len(tree), WRITE_BATCH):
+            stop = min(start + WRITE_BATCH, len(tree))
+            chunk = bytearray(RECORD.size * (stop - start))
+            for offset, i in enumerate(range(start, stop)):
+                RECORD.pack_into(chunk, offset * RECORD.size, values[i], left[i], right[i])
+            fp.write(chunk)
+
+
+class MappedNode:
+    """Read-only node backed by one record of a MappedTree."""
+    __slots__ = ('value', '_tree', '_left', '_right')
+
+    def __init__(self, tree, value, left, right):
+        self._tree = tree
+        self.value = value
+        self._left = left
+        self._right = right
+
+    @property
+    def left(self):
+        return self._tree.node(self._left) if self._left != NIL else None
+
+    @property
+    def right(self):
+        return self._tree.node(self._right) if self._right != NIL else None
+
+    def __repr__(self):
+        return f'MappedNode({self.value!r})'
+
+
+class MappedTree:
+    def __init__(self, path):
+        """
+        Open a file written by save_mapped_tree
+        Time Complexity: O(1)
+        """
+        # Set before any check so close() works on a rejected file
+        self._nodes = {}
+        self.root = None
+        self._mm = None
+        self._file = open(path, 'rb')
+        try:
+            length = os.fstat(self._file.fileno()).st_size
+            if length < HEADER.size:
+                raise ValueError(f'{path} is not a mapped tree file (too short)')
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self.size, root = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise ValueError(f'{path} is not a mapped tree file')
+            if length < HEADER.size + self.size * RECORD.size:
+                raise ValueError(f'{path} is truncated: {self.size} records expected')
+        except Exception:
+            self.close()
+            raise
+        # Each record is materialized at most once, so node identity is
+        # stable (lowestCommonAncestor compares nodes with 'is').
+        self.root = self.node(root) if root != NIL else None
+
+    def node(self, index):
+        """
+        Materialize (or return the cached) node stored at record index
+        Time Complexity: O(1)
+        """
+        node = self._nodes.get(index)
+        if node is None:
+            if not 0 <= index < self.size:
+                raise IndexError(f'node index {index} out of range')
+            value, left, right = RECORD.unpack_from(self._mm, HEADER.size + index * RECORD.size)
+            node = MappedNode(self, value, left, right)
+            self._nodes[index] = node
+        return node
+
+    @property
+    def loaded(self):
+        """Number of nodes materialized so far."""
+        return len(self._nodes)
+
+    def close(self):
+        self._nodes.clear()
+        self.root = None
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from Tree import TreeNode
+
+    helper = TreeNode(0)
+    bst = helper.sortedArrayToBST(list(range(1, 100001)))
+    path = os.path.join(tempfile.mkdtemp(), 'bst.trm')
+    save_mapped_tree(bst, path)
+
+    with MappedTree(path) as tree:
+        print("nodes on disk:", tree.size)
+        p = tree.root.left.left.right
+        q = tree.root.left.right.left
+        lca = helper.lowestCommonAncestor_in_BST(tree.root, p, q)
+        print("LCA of", p.value, "and", q.value, "is", lca.value)
+        # Sum along the leftmost root-to-leaf path, found after one descent
+        target, node = 0, tree.root
+        while node:
+            target += node.value
+            node = node.left or node.right
+        print("hasPathSum:", helper.hasPathSum(tree.root, target))
+        print("nodes loaded:", tree.loaded)
@@ -0,0 +1,202 @@
+"""
+ORDER-STATISTIC AVL TREE
+========================
+
+Dynamic ordered set that stays balanced under inserts and deletes.
+Every node also stores
+    height -> for the AVL balance check (|h(left) - h(right)| <= 1)
+    size   -> number of nodes in its subtree, for rank/select
+
+so rank, select (k-th smallest) and range counts are O(log n).
+
+AVLNode subclasses TreeNode, so the tree under OrderStatisticTree.root
+works with the existing TreeNode methods (inorder_traversal, isValidBST,
+isBalanced, lowestCommonAncestor_in_BST, ...).
+
+Duplicates are ignored (set semantics), matching isValidBST's strict order.
+"""
+from Tree import TreeNode
+
+
+class AVLNode(TreeNode):
+    __slots__ = ('height', 'size')
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.height = 1
+        self.size = 1
+
+
+def _height(node):
+    return node.height if node else 0
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _update(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        # Left-Right case first turns into Left-Left
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        # Right-Left case first turns into Right-Right
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class OrderStatisticTree:
+    def __init__(self, values=()):
+        self.root = None
+        for value in values:
+            self.insert(value)
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __contains__(self, value):
+        node = self.root
+        while node:
+            if value == node.value:
+                return True
+            node = node.left if value < node.value else node.right
+        return False
+
+    def __iter__(self):
+        return self.root.iter_inorder(self.root) if self.root else iter(())
+
+    def insert(self, value):
+        """
+        Insert value, returns False if it was already present
+        Time Complexity: O(log n)
+        """
+        before = len(self)
+        self.root = self._insert(self.root, value)
+        return len(self) != before
+
+    def _insert(self, node, value):
+        if not node:
+            return AVLNode(value)
+        if value == node.value:
+            return node
+        if value < node.value:
+            node.left = self._insert(node.left, value)
+        else:
+            node.right = self._insert(node.right, value)
+        return _rebalance(node)
+
+    def remove(self, value):
+        """
+        Remove value, returns False if it was not present
+        Time Complexity: O(log n)
+        """
+        before = len(self)
+        self.root = self._remove(self.root, value)
+        return len(self) != before
+
+    def _remove(self, node, value):
+        if not node:
+            return None
+        if value < node.value:
+            node.left = self._remove(node.left, value)
+        elif value > node.value:
+            node.right = self._remove(node.right, value)
+        else:
+            if not node.left:
+                return node.right
+            if not node.right:
+                return node.left
+            # Replace with the inorder successor, then delete that one
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.value = successor.value
+            node.right = self._remove(node.right, successor.value)
+        return _rebalance(node)
+
+    # ORDER STATISTICS
+    def rank(self, value):
+        """
+        Number of stored values strictly less than value
+        Time Complexity: O(log n)
+        """
+        count = 0
+        node = self.root
+        while node:
+            if value <= node.value:
+                node = node.left
+            else:
+                count += _size(node.left) + 1
+                node = node.right
+        return count
+
+    def select(self, k):
+        """
+        k-th smallest value (1-based, like Heap.kth_smallest)
+        Time Complexity: O(log n)
+        """
+        if not 1 <= k <= len(self):
+            raise IndexError(f'k={k} out of range for {len(self)} values')
+        node = self.root
+        while node:
+            left_size = _size(node.left)
+            if k <= left_size:
+                node = node.left
+            elif k == left_size + 1:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def range_count(self, low, high):
+        """
+        Number of stored values v with low <= v <= high
+        Time Complexity: O(log n)
+        """
+        if high < low:
+            return 0
+        below_high = self.rank(high) + (1 if high in self else 0)
+        return below_high - self.rank(low)
+
+
+if __name__ == "__main__":
+    tree = OrderStatisticTree([50, 20, 70, 10, 30, 60, 80, 25, 35])
+    print("inorder:", list(tree))
+    print("3rd smallest:", tree.select(3))
+    print("rank of 60:", tree.rank(60))
+    print("count in [20, 60]:", tree.range_count(20, 60))
+
+    tree.remove(20)
+    tree.insert(5)
+    helper = tree.root
+    print("after remove 20 / insert 5:", helper.inorder_traversal(tree.root))
+    print("valid BST:", helper.isValidBST(tree.root), "balanced:", helper.isBalanced(tree.root))
@@ -0,0 +1,274 @@
+"""
+PROCESS-PARALLEL TREE AGGREGATES
+================================
+
+The tree is converted once to a CompactTree (preorder layout). In preorder
+every subtree is a contiguous slice of the arrays, so a subtree is shipped
+to a worker as three array slices (pickled as raw bytes) instead of a
+graph of node objects.
+
+Evaluation:
+1. Frontier: the first BFS level with at least `parts` nodes. Nodes above
+   it form the small "top" of the tree, evaluated in the parent.
+2. Each frontier subtree is evaluated in a process pool, seeded with the
+   state of the path above it (prefix number, remaining sum, ...).
+3. The parent combines the partial results at the root.
+
+The conversion to CompactTree is serial and done once per evaluator, so
+create one evaluator and run many queries on it.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+from compact_tree import NIL, CompactTree
+
+
+def _evaluate_subtree(task):
+    """Worker: evaluate one preorder slice [offset, offset + len(values))."""
+    op, values, left, right, offset, seed = task
+
+    def local(i):
+        return i - offset if i != NIL else NIL
+
+    if op == 'preorder':
+        return values.tolist() if hasattr(values, 'tolist') else list(values)
+
+    if op == 'inorder':
+        result, stack, i = [], [], 0
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = local(left[i])
+            i = stack.pop()
+            result.append(values[i])
+            i = local(right[i])
+        return result
+
+    if op == 'max_depth':
+        best = 0
+        stack = [(0, 1)]
+        while stack:
+            i, depth = stack.pop()
+            if depth > best:
+                best = depth
+            for child in (left[i], right[i]):
+                if child != NIL:
+                    stack.append((local(child), depth + 1))
+        return best
+
+    if op == 'sum_numbers':
+        total = 0
+        stack = [(0, seed)]
+        while stack:
+            i, current = stack.pop()
+            current = current * 10 + values[i]
+            if left[i] == NIL and right[i] == NIL:
+                total += current
+                continue
+            for child in (left[i], right[i]):
+                if child != NIL:
+                    stack.append((local(child), current))
+        return total
+
+    if op == 'has_path_sum':
+        stack = [(0, seed)]
+        while stack:
+            i, remaining = stack.pop()
+            remaining -= values[i]
+            if left[i] == NIL and right[i] == NIL:
+                if remaining == 0:
+                    return True
+                continue
+            for child in (left[i], right[i]):
+                if child != NIL:
+                    stack.append((local(child), remaining))
+        return False
+
+    raise ValueError(f'unknown operation {op!r}')
+
+
+class ParallelTreeEvaluator:
+    def __init__(self, root, processes=None, parts=None, typecode='q'):
+        """
+        root: TreeNode root or an existing CompactTree (re-laid out in
+              preorder first if it is not already)
+        processes: pool size (default: os.cpu_count())
+        parts: minimum number of subtrees to split into (default: 4 per process)
+        """
+        if isinstance(root, CompactTree):
+            if root.is_preorder():
+                self.tree = root
+            else:
+                # Subtrees must be contiguous slices to be shipped to workers
+                self.tree = CompactTree.from_treenode(root.to_treenode(), root.typecode)
+        else:
+            self.tree = CompactTree.from_treenode(root, typecode)
+        self.processes = processes or os.cpu_count() or 1
+        self.parts = parts or 4 * self.processes
+        self._pool = None
+        self._split()
+
+    def _split(self):
+        """Find the frontier level and the preorder slice of each frontier subtree."""
+        tree = self.tree
+        left, right = tree.left, tree.right
+        self.top = set()
+        self.frontier_depth = 0
+        self.slices = {}
+        level = [tree.root] if tree.root != NIL else []
+        while level and len(level) < self.parts:
+            self.top.update(level)
+            level = [c for i in level for c in (left[i], right[i]) if c != NIL]
+            self.frontier_depth += 1
+        frontier = level
+        # A frontier subtree ends where the next top or frontier node starts
+        boundaries = sorted(self.top.union(frontier))
+        boundaries.append(len(tree))
+        position = {idx: k for k, idx in enumerate(boundaries)}
+        for idx in frontier:
+            self.slices[idx] = (idx, boundaries[position[idx] + 1])
+
+    def _run(self, op, seeds):
+        """Evaluate op on every frontier subtree in seeds {index: seed}."""
+        if not seeds:
+            return {}
+        values, left, right = self.tree.values, self.tree.left, self.tree.right
+        tasks = []
+        for idx, seed in seeds.items():
+            start, stop = self.slices[idx]
+            tasks.append((op, values[start:stop], left[start:stop],
+                          right[start:stop], start, seed))
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.processes)
+        return dict(zip(seeds, self._pool.map(_evaluate_subtree, tasks)))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # PARALLEL OPERATIONS (same results as the TreeNode methods)
+    def maxDepth(self):
+        """
+        Maximum Depth of Binary Tree
+        Time Complexity: O(n / p) per worker plus O(top) in the parent
+        """
+        if self.slices:
+            depths = self._run('max_depth', dict.fromkeys(self.slices))
+            return self.frontier_depth + max(depths.values())
+        return self.tree.maxDepth()
+
+    def sumNumbers(self):
+        """
+        Sum Root to Leaf Numbers
+        Time Complexity: O(n / p) per worker plus O(top) in the parent
+        """
+        values, left, right = self.tree.values, self.tree.left, self.tree.right
+        total = 0
+        seeds = {}
+        stack = [(self.tree.root, 0)] if self.tree.root != NIL else []
+        while stack:
+            i, current = stack.pop()
+            if i in self.slices:
+                # The worker continues from the number formed above it
+                seeds[i] = current
+                continue
+            current = current * 10 + values[i]
+            if left[i] == NIL and right[i] == NIL:
+                total += current
+            for child in (left[i], right[i]):
+                if child != NIL:
+                    stack.append((child, current))
+        return total + sum(self._run('sum_numbers', seeds).values())
+
+    def hasPathSum(self, targetSum):
+        """
+        Path Sum Check
+        Time Complexity: O(n / p) per worker plus O(top) in the parent
+        """
+        values, left, right = self.tree.values, self.tree.left, self.tree.right
+        seeds = {}
+        stack = [(self.tree.root, targetSum)] if self.tree.root != NIL else []
+        while stack:
+            i, remaining = stack.pop()
+            if i in self.slices:
+                seeds[i] = remaining
+                continue
+            remaining -= values[i]
+            if left[i] == NIL and right[i] == NIL:
+                if remaining == 0:
+                    return True
+            for child in (left[i], right[i]):
+                if child != NIL:
+                    stack.append((child, remaining))
+        return any(self._run('has_path_sum', seeds).values())
+
+    def preorder_traversal(self):
+        """
+        Preorder Traversal (Root → Left → Right)
+        The preorder layout already is the answer, slices are copied in parallel
+        """
+        parts = self._run('preorder', dict.fromkeys(self.slices))
+        values = self.tree.values
+        result = []
+        i = 0
+        while i < len(values):
+            if i in parts:
+                result.extend(parts[i])
+                i = self.slices[i][1]
+            else:
+                result.append(values[i])
+                i += 1
+        return result
+
+    def inorder_traversal(self):
+        """
+        Inorder Traversal (Left → Root → Right)
+        Inorder over the top of the tree, splicing in each frontier
+        subtree's inorder list where its root would appear
+        """
+        parts = self._run('inorder', dict.fromkeys(self.slices))
+        values, left, right = self.tree.values, self.tree.left, self.tree.right
+        result, stack = [], []
+        i = self.tree.root
+        while stack or i != NIL:
+            while i != NIL and i not in parts:
+                stack.append(i)
+                i = left[i]
+            if i != NIL:
+                result.extend(parts[i])
+            if not stack:
+                break
+            i = stack.pop()
+            result.append(values[i])
+            i = right[i]
+        return result
+
+
+if __name__ == "__main__":
+    import time
+
+    from Tree import TreeNode
+
+    helper = TreeNode(0)
+    digits = [i % 10 for i in range(1 << 18)]
+    root = helper.buildTree_from_levelorder(digits[:1] + [d or 1 for d in digits[1:]])
+
+    with ParallelTreeEvaluator(root) as evaluator:
+        for name, parallel, serial in (
+            ('maxDepth', evaluator.maxDepth, lambda: helper.maxDepth(root)),
+            ('sumNumbers', evaluator.sumNumbers, lambda: helper.sumNumbers(root)),
+            ('inorder', evaluator.inorder_traversal, lambda: helper.inorder_traversal(root)),
+        ):
+            start = time.perf_counter()
+            result = parallel()
+            mid = time.perf_counter()
+            same = result == serial()
+            end = time.perf_counter()
+            print(f'{name}: parallel {mid - start:.3f}s serial {end - mid:.3f}s match={same}')
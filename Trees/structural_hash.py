@@ -0,0 +1,143 @@
+"""
+STRUCTURAL (MERKLE) HASHING OF SUBTREES
+=======================================
+
+Each subtree gets a 16-byte digest computed bottom-up:
+
+    digest(None) = H(b'null')
+    digest(node) = H(repr(value) | digest(left) | digest(right))
+
+so two subtrees have the same digest exactly when they have the same
+shape and values (up to a negligible 2^-128 collision chance). Digests are
+cached per node, so after one O(n) pass:
+    - subtree equality is an O(1) digest comparison
+    - duplicate subtrees are found by grouping equal digests
+    - a tree can be deduplicated into a DAG where equal subtrees share one node
+
+Digests do not depend on the hasher instance, so they can also be compared
+across datasets and processes. Cached digests go stale if a tree is edited
+afterwards; call forget() to drop them.
+"""
+from hashlib import blake2b
+
+from Tree import TreeNode
+
+DIGEST_SIZE = 16
+NULL_DIGEST = blake2b(b'null', digest_size=DIGEST_SIZE).digest()
+
+
+class StructuralHasher:
+    def __init__(self):
+        self._digests = {}
+
+    def digest(self, root):
+        """
+        Digest of the subtree under root, hashing only uncached nodes
+        Time Complexity: O(n) the first time, O(1) once cached
+        Space Complexity: O(n) for the cache
+        """
+        if root is None:
+            return NULL_DIGEST
+        digests = self._digests
+        if root in digests:
+            return digests[root]
+        # Iterative postorder over the uncached part of the subtree
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            pending = [child for child in (node.left, node.right)
+                       if child is not None and child not in digests]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            h = blake2b(repr(node.value).encode(), digest_size=DIGEST_SIZE)
+            h.update(digests[node.left] if node.left else NULL_DIGEST)
+            h.update(digests[node.right] if node.right else NULL_DIGEST)
+            digests[node] = h.digest()
+        return digests[root]
+
+    def same_subtree(self, a, b):
+        """
+        Same Tree Check by digest
+        Time Complexity: O(1) once both subtrees are hashed
+        """
+        return self.digest(a) == self.digest(b)
+
+    def find_duplicate_subtrees(self, root):
+        """
+        One root node for every subtree structure that occurs more than once
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        self.digest(root)
+        seen = {}
+        duplicates = []
+        for node in self._postorder_nodes(root):
+            d = self._digests[node]
+            count = seen.get(d, 0)
+            if count == 1:
+                duplicates.append(node)
+            seen[d] = count + 1
+        return duplicates
+
+    def dedupe(self, root):
+        """
+        Copy the tree into a DAG in which equal subtrees share one TreeNode
+        Returns (new_root, number of distinct nodes)
+        The DAG is meant to be read: traversals, views, serialize, maxDepth,
+        isBalanced, isValidBST, sumNumbers and hasPathSum see it as the
+        original tree (shared subtrees are walked once per occurrence).
+        Editing a shared node changes every occurrence, and Morris walks
+        and parent-map methods (lowestCommonAncestor) assume a real tree.
+        Time Complexity: O(n)
+        Space Complexity: O(number of distinct subtrees)
+        """
+        self.digest(root)
+        canonical = {}
+        for node in self._postorder_nodes(root):
+            d = self._digests[node]
+            if d in canonical:
+                continue
+            copy = TreeNode(node.value)
+            copy.left = canonical[self._digests[node.left]] if node.left else None
+            copy.right = canonical[self._digests[node.right]] if node.right else None
+            canonical[d] = copy
+        return (canonical[self._digests[root]] if root else None), len(canonical)
+
+    def forget(self):
+        """Drop all cached digests (needed after editing a hashed tree)."""
+        self._digests.clear()
+
+    def _postorder_nodes(self, root):
+        # Reverse of a Root → Right → Left walk
+        order = []
+        stack = [root] if root else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        order.reverse()
+        return order
+
+
+if __name__ == "__main__":
+    helper = TreeNode(0)
+    #        1
+    #       / \
+    #      2   3
+    #     /   / \
+    #    4   2   4
+    #       /
+    #      4
+    root = helper.buildTree_from_levelorder([1, 2, 3, 4, -1, 2, 4, -1, -1, 4])
+    hasher = StructuralHasher()
+    print("left subtree == right.left:", hasher.same_subtree(root.left, root.right.left))
+    print("duplicates:", [helper.serialize(node) for node in hasher.find_duplicate_subtrees(root)])
+    dag, distinct = hasher.dedupe(root)
+    print("distinct nodes after dedupe:", distinct, "of", len(helper.preorder_traversal(root)))
+    print("DAG reads the same:", helper.serialize(dag) == helper.serialize(root))
+    print("DAG balanced like the tree:", helper.isBalanced(dag) == helper.isBalanced(root))
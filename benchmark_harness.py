@@ -0,0 +1,79 @@
+"""
+SHARED BENCHMARK HARNESS
+========================
+
+Timing, memory measurement, command line and JSON-lines output shared by
+Trees/benchmark.py and Heap/benchmark.py, so both suites measure and
+record results the same way.
+
+Each case is timed as the best of `repeat` runs (wall time,
+time.perf_counter) and then run once more under tracemalloc for the peak
+memory it allocates. Cases that fail with RecursionError or MemoryError
+are recorded with an "error" field instead of a time.
+
+Run as scripts (python Trees/benchmark.py ...), the suites add the
+repository root to sys.path themselves. Code importing a suite as a module
+needs both the repository root and the suite's folder on sys.path.
+"""
+from contextlib import contextmanager
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+
+def measure(run, args, repeat, memory):
+    """Best wall time over repeat runs, plus peak traced memory of one more run."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(*args)
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if memory:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        run(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, peak
+
+
+def common_fields(label):
+    """Fields stored in every record of one suite run."""
+    return {
+        'label': label,
+        'python': platform.python_version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def run_case(out, record, run, make_args, repeat, memory):
+    """Prepare the inputs, time run(*args) into record and write it as one JSON line."""
+    try:
+        args = make_args()
+        record['seconds'], record['peak_bytes'] = measure(run, args, repeat, memory)
+    except (RecursionError, MemoryError) as exc:
+        record['error'] = type(exc).__name__
+    out.write(json.dumps(record) + '\n')
+    out.flush()
+
+
+def add_common_arguments(parser, default_sizes, sizes_help='workload sizes, e.g. 1e3 1e6'):
+    parser.add_argument('--sizes', nargs='+', default=default_sizes,
+                        type=lambda s: int(float(s)), help=sizes_help)
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc run')
+    parser.add_argument('--label', help='version label stored in every record')
+    parser.add_argument('--output', help='JSON lines file (default: stdout)')
+
+
+@contextmanager
+def open_output(path):
+    """Append to path, or write to stdout when no path is given."""
+    if not path:
+        yield sys.stdout
+        return
+    with open(path, 'a') as out:
+        yield out